@@ -1,17 +1,39 @@
 import asyncio
 import json
 from langchain_core.messages import HumanMessage, SystemMessage
-from tools import create_tools
+from tool_registry import get_bound_model, get_tool, invoke_tool
+from tools import UNCHECKED_VALUES
 from form_fill_agent import FormFillAgent
+from readiness import modal_step_signature, wait_for_modal_step_change, polite_pause
+from answer_memory import get_answer_memory
+from llm_resilience import llm_invoke, llm_available
+from run_metrics import run_metrics
+from manual_input import manual_input_allowed, ask_human
 import os
+import time
+
+# form_fill_tool (element_type, action) for each answer element_type the dispatcher
+# fills directly. The parsers report inputs by their type attribute (text, email, ...).
+FILL_ACTIONS = {
+    'input': ('input', 'fill'),
+    'text': ('input', 'fill'),
+    'email': ('input', 'fill'),
+    'tel': ('input', 'fill'),
+    'number': ('input', 'fill'),
+    'url': ('input', 'fill'),
+    'textarea': ('textarea', 'fill'),
+    'select': ('select', 'select'),
+    'radio': ('radio', 'click')
+}
 
 class FormValueFillerAgent:
     def __init__(self, navigator, llm_model, resume_path):
         self.navigator = navigator
         self.llm_model = llm_model
         self.resume_path = resume_path
-        self.tools = create_tools(navigator, resume_path)
-        self.model_with_tools = llm_model.bind_tools(self.tools)
+        self.model_with_tools = get_bound_model(llm_model)
+        # Questions skipped because they need a person; the job is recorded as needs_manual
+        self.needs_manual = []
         
     # async def fill_form_values(self, answers):
     #     """
@@ -71,17 +93,23 @@ class FormValueFillerAgent:
 
         resume_fields = [f for f in answers if upload_related(f.get("question"))]
 
+        prompts_allowed = manual_input_allowed(self.navigator.browser_profile)
+
         # Manually handle resume upload if not already uploaded
         if resume_fields and not resume_uploaded:
             print("\n📄 Detected resume upload field(s).")
-            print("Please upload your resume manually in the browser.")
-            input("⏸️ Press Enter after you've uploaded the resume to continue...")
+            if prompts_allowed:
+                print("Please upload your resume manually in the browser.")
+                await ask_human("⏸️ Press Enter after you've uploaded the resume to continue...", self.navigator.page.url)
 
-            # ✅ Mark resume as uploaded in user_profile
-            user_profile["resume_uploaded"] = True
-            with open(user_profile_path, "w") as f:
-                json.dump(user_profile, f, indent=2)
-            print("✅ Resume upload recorded in user_profile.json")
+                # ✅ Mark resume as uploaded in user_profile
+                user_profile["resume_uploaded"] = True
+                with open(user_profile_path, "w") as f:
+                    json.dump(user_profile, f, indent=2)
+                print("✅ Resume upload recorded in user_profile.json")
+            else:
+                print("⏭️ Skipping resume upload, it needs manual input")
+                self.needs_manual.extend(f.get('question') for f in resume_fields)
 
         # Remove all resume-related fields from processing
         filtered_answers = [f for f in answers if not upload_related(f.get("question"))]
@@ -106,18 +134,94 @@ class FormValueFillerAgent:
                 print(f"   - {field.get('question', 'Unknown question')}")
                 print(f"     Element ID: {field.get('element_id', 'Unknown')}")
 
-            print("\n🛑 AUTOMATION PAUSED")
-            print("Please manually fill the remaining fields in the browser.")
-            input("▶️ Press Enter to resume automation after manual input...")
+            if prompts_allowed:
+                print("\n🛑 AUTOMATION PAUSED")
+                print("Please manually fill the remaining fields in the browser.")
+                await ask_human("▶️ Press Enter to resume automation after manual input...", self.navigator.page.url)
+            else:
+                print("⏭️ Leaving them empty; the job is marked as needing manual input")
+                self.needs_manual.extend(f.get('question') for f in fields_without_values)
 
         return True, []
 
     
     async def _fill_fields_with_values(self, fields_with_values):
-        """Fill fields that have predetermined values"""
-        print("\n🤖 LLM filling fields with predetermined values...")
-        
-        # Create system message for filling fields
+        """Fill fields that have predetermined values, asking the LLM only for fields the dispatcher cannot fill"""
+        print("\n🤖 Filling fields with predetermined values...")
+
+        # One radio index per form step, shared by every radio answer on it
+        if any(f.get('element_type', '').lower() == 'radio' for f in fields_with_values):
+            try:
+                await self.navigator.refresh_radio_index()
+            except Exception as e:
+                print(f"⚠️ Failed to index radio inputs: {e}")
+
+        for field in fields_with_values:
+            question = field.get('question', 'Unknown')
+            print(f"   Filling: '{question}' with value: '{field.get('value')}'")
+
+            started = time.perf_counter()
+            path = "direct"
+            result = await self._dispatch_fill(field)
+            if result is None or not str(result).startswith("✅"):
+                if result is not None:
+                    print(f"   ↪️ Direct fill failed ({result}), asking LLM")
+                path = "llm"
+                result = await self._fill_field_with_llm(field)
+
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            run_metrics.observe(f"field_fill_{path}", elapsed_ms)
+            print(f"   ⏱️ {path} fill took {elapsed_ms:.0f}ms")
+
+            if str(result).startswith("✅"):
+                print(f"✅ Filled successfully")
+                self._remember_answer(field)
+                await polite_pause(1)  # Small delay between fills
+            else:
+                print(f"❌ Failed to fill field: {result}")
+
+        self._flush_answer_memory()
+        return True
+
+    def _fill_action(self, field):
+        """
+        Map an answer to form_fill_tool arguments by its element_type.
+        Returns None when the field cannot be filled without the LLM.
+        """
+        element_id = field.get('element_id')
+        element_type = (field.get('element_type') or 'input').lower()
+        value = field.get('value')
+        if not element_id or value is None:
+            return None
+
+        if element_type in FILL_ACTIONS:
+            element_type, action = FILL_ACTIONS[element_type]
+        elif element_type == 'checkbox':
+            # A yes/no value sets a single checkbox; any other value ticks that option of a group
+            flag = str(value).strip().lower()
+            action = "uncheck" if flag in UNCHECKED_VALUES else "check"
+        else:
+            return None
+
+        return {"element_id": element_id, "value": str(value), "element_type": element_type, "action": action}
+
+    async def _dispatch_fill(self, field):
+        """Fill a field directly with form_fill_tool. Returns the tool result, or None if not dispatchable."""
+        tool_args = self._fill_action(field)
+        if tool_args is None:
+            return None
+        try:
+            return await invoke_tool(self.navigator, "form_fill_tool", tool_args)
+        except Exception as e:
+            return f"Error: {e}"
+
+    async def _fill_field_with_llm(self, field):
+        """Ask the LLM for a fill tool call for one field and run it"""
+        element_id = field.get('element_id')
+        question = field.get('question', 'Unknown')
+        value = field.get('value')
+        element_type = field.get('element_type', 'input').lower()
+
         system_message = SystemMessage(content="""
             ROLE: Form Field Filler Agent
 
@@ -134,68 +238,72 @@ class FormValueFillerAgent:
             - Do NOT attempt to submit or navigate - only fill fields
             - If a field cannot be filled, skip it and continue
         """)
-        
-        for field in fields_with_values:
-            element_id = field.get('element_id')
-            question = field.get('question', 'Unknown')
-            value = field.get('value')
-            element_type = field.get('element_type', 'input').lower()
-            
-            print(f"   Filling: '{question}' with value: '{value}'")
-            
-            
-            human_message = HumanMessage(content=f"""
-                Fill the form field with the following details:
-                - Element ID: {element_id}
-                - Question: {question}
-                - Value to fill: {value}
-                - Element Type: {element_type}
-
-                INSTRUCTIONS:
-                - Use correct tool based on element_type.
-                - For radio buttons, make sure to resolve the input ID before clicking.
-                - For dropdowns (select), ensure value matches available option.
-                - For input/textarea, insert the value directly.
-            """)
-            
-            try:
-                response = await self.model_with_tools.ainvoke([system_message, human_message])
-                
-                if response.tool_calls:
-                    tool_call = response.tool_calls[0]
-                    tool_name = tool_call['name']
-                    # tool_args = tool_call['args']
-                    tool_args = {
-                        "element_id": tool_call['args'].get("element_id", field.get("element_id")),
-                        "value": tool_call['args'].get("value", field.get("value")),
-                        "element_type": tool_call['args'].get("element_type", field.get("element_type", "input").lower()),
-                        "action": tool_call['args'].get("action", "fill")
-                    }
-                    
-                    tool = next((t for t in self.tools if t.name == tool_name), None)
-                    if tool:
-                        try:
-                            await tool.ainvoke(tool_args)
-                            print(f"✅ Filled successfully")
-                            await asyncio.sleep(1)  # Small delay between fills
-                        except Exception as e:
-                            print(f"❌ Failed to fill field: {e}")
 
-                else:
-                    print(f"❌ No tool call made for field")
-                    
-            except Exception as e:
-                print(f"❌ Error filling field: {e}")
-                
-        return True
-    
+        human_message = HumanMessage(content=f"""
+            Fill the form field with the following details:
+            - Element ID: {element_id}
+            - Question: {question}
+            - Value to fill: {value}
+            - Element Type: {element_type}
+
+            INSTRUCTIONS:
+            - Use correct tool based on element_type.
+            - For radio buttons, make sure to resolve the input ID before clicking.
+            - For dropdowns (select), ensure value matches available option.
+            - For input/textarea, insert the value directly.
+        """)
+
+        try:
+            response = await llm_invoke(self.model_with_tools, [system_message, human_message], "field_fill")
+        except Exception as e:
+            return f"Error filling field: {e}"
+
+        if not response.tool_calls:
+            return "Error: No tool call made for field"
+
+        tool_call = response.tool_calls[0]
+        tool_name = tool_call['name']
+        tool_args = {
+            "element_id": tool_call['args'].get("element_id", element_id),
+            "value": tool_call['args'].get("value", value),
+            "element_type": tool_call['args'].get("element_type", element_type),
+            "action": tool_call['args'].get("action", "fill")
+        }
+        if not get_tool(tool_name):
+            return f"Error: Unknown tool '{tool_name}'"
+        try:
+            return await invoke_tool(self.navigator, tool_name, tool_args)
+        except Exception as e:
+            return f"Error: {e}"
+
+    def _remember_answer(self, field):
+        """Write a successfully filled answer back to the answer memory"""
+        try:
+            get_answer_memory().record(
+                field.get('question'),
+                field.get('element_type'),
+                field.get('value'),
+                options=field.get('options'),
+                source=field.get('source', 'llm'),
+                job_url=self.navigator.page.url
+            )
+        except Exception as e:
+            print(f"⚠️ Failed to remember answer: {e}")
+
+    def _flush_answer_memory(self):
+        """Persist the answers remembered on this form step in one write"""
+        try:
+            get_answer_memory().flush()
+        except Exception as e:
+            print(f"⚠️ Failed to save answer memory: {e}")
+
     async def handle_form_submission(self):
         """
         Handle form submission by pressing Next/Review/Submit buttons
         Returns: 'next', 'review', 'submit', or 'error'
         """
         print("\n🎯 Handling form submission...")
-        elements_info = await self.navigator.get_page_elements()
+        elements_info = await self.navigator.get_form_step_elements()
         
         # Process button information to extract just the text content
         button_texts = []
@@ -210,6 +318,9 @@ class FormValueFillerAgent:
             if text and text.strip():
                 button_texts.append(text.strip())
         
+        if not llm_available():
+            return await self._click_submission_button(button_texts)
+
         # Create a clean list of available buttons for the AI
         available_buttons = "\n".join([f"- {text}" for text in button_texts if text])
         
@@ -260,7 +371,7 @@ class FormValueFillerAgent:
 
         
         try:
-            response = await self.model_with_tools.ainvoke([system_message, human_message])
+            response = await llm_invoke(self.model_with_tools, [system_message, human_message], "form_submission")
             
             if response.tool_calls:
                 tool_call = response.tool_calls[0]
@@ -270,10 +381,9 @@ class FormValueFillerAgent:
                 # Debug: Print what the AI is trying to click
                 print(f"🔍 AI attempting to click: {tool_args}")
                 
-                tool = next((t for t in self.tools if t.name == tool_name), None)
-                if tool:
+                if get_tool(tool_name):
                     try:
-                        result = await tool.ainvoke(tool_args)
+                        result = await invoke_tool(self.navigator, tool_name, tool_args)
                         response_text = str(result).strip().lower()
                         print(f"🔄 Click result: {response_text}")
                         
@@ -305,6 +415,21 @@ class FormValueFillerAgent:
             print(f"❌ Error in form submission: {e}")
             return 'error'
     
+    async def _click_submission_button(self, button_texts):
+        """Click Submit, else Review, else Next without the LLM (used while it is unavailable)"""
+        for kind in ['submit', 'review', 'next']:
+            text = next((t for t in button_texts if kind in t.lower()), None)
+            if not text:
+                continue
+            result = await invoke_tool(self.navigator, "click_element", {"element_type": "button", "identifier": text})
+            if str(result).startswith("Successfully"):
+                print(f"🔄 Clicked '{text}'")
+                return kind
+            print(f"❌ Click failed: {result}")
+            return 'error'
+        print("❌ No Submit/Review/Next button found")
+        return 'error'
+
     async def complete_form_process(self, initial_answers):
         """
         Complete the entire form filling and submission process
@@ -325,14 +450,15 @@ class FormValueFillerAgent:
                 print("❌ Form filling failed")
                 return False
             
-            # Wait a moment for fields to be processed
-            await asyncio.sleep(2)
+            await polite_pause(2)
             
             # Handle form submission
+            step_signature = await modal_step_signature(self.navigator.page)
             submission_result = await self.handle_form_submission()
             
             if submission_result == 'next':
                 print("➡️ Next button clicked - extracting questions for next step...")
+                await wait_for_modal_step_change(self.navigator.page, step_signature)
                 
                 print("\n \n")
                 
@@ -381,7 +507,8 @@ class FormValueFillerAgent:
                     
             elif submission_result == 'review':
                 print("👀 Review button clicked - proceeding to final submission...")
-                await asyncio.sleep(2)
+                await wait_for_modal_step_change(self.navigator.page, step_signature)
+                await polite_pause(2)
                 
                 # Try to submit after review
                 final_submission = await self.handle_form_submission()
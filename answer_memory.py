@@ -0,0 +1,208 @@
+import difflib
+import hashlib
+import json
+import os
+import re
+import time
+from config import ANSWER_MEMORY_PATH, ANSWER_MEMORY_MATCH_THRESHOLD
+from run_metrics import run_metrics
+
+OPTION_TYPES = ['select', 'radio', 'checkbox', 'multiplechoice']
+
+# Filler words that may differ between wordings of the same question.
+# Everything else (skills, tools, places) must match exactly for a fuzzy hit.
+_FILLER_WORDS = {
+    'a', 'an', 'the', 'of', 'in', 'on', 'at', 'to', 'for', 'with', 'and', 'or',
+    'do', 'does', 'you', 'your', 'have', 'has', 'are', 'is', 'be', 'been',
+    'what', 'how', 'many', 'much', 'total', 'overall', 'work', 'working',
+    'professional', 'please', 'enter', 'provide', 'currently', 'current'
+}
+
+# Profile keys that track automation state rather than facts about the candidate
+_PROFILE_STATE_KEYS = ['resume_uploaded']
+
+
+def normalize_question(text):
+    """Lowercase, drop punctuation/required markers and collapse whitespace"""
+    text = (text or "").lower()
+    text = re.sub(r"\brequired\b", " ", text)
+    text = re.sub(r"[^\w\s+#]", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def content_words(normalized_text):
+    """Words of a normalized question that carry its meaning"""
+    return frozenset(w for w in normalized_text.split() if w not in _FILLER_WORDS)
+
+
+def _option_text(option):
+    if isinstance(option, dict):
+        option = option.get('value') or option.get('text') or ""
+    return normalize_question(str(option))
+
+
+def options_key(element_type, options):
+    """Key for the set of choices a question offers ('' for free-text fields)"""
+    if (element_type or "").lower() not in OPTION_TYPES or not options:
+        return ""
+    return "|".join(sorted(_option_text(o) for o in options))
+
+
+class AnswerMemory:
+    """
+    Local store of confirmed answers, keyed by normalized question text,
+    element type and option set, so recurring screening questions skip the LLM.
+    """
+
+    def __init__(self, path=ANSWER_MEMORY_PATH, match_threshold=ANSWER_MEMORY_MATCH_THRESHOLD):
+        self.path = path
+        self.match_threshold = match_threshold
+        self.sources_fingerprint = None
+        self.entries = {}
+        # (element_type, options_key) -> entry keys, for fuzzy matching within a bucket
+        self.buckets = {}
+        self.hits = 0
+        self.misses = 0
+        # Set by record(); the store is written once per form step by flush()
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            self.sources_fingerprint = data.get("sources_fingerprint")
+            for key, entry in data.get("entries", {}).items():
+                self._index(key, entry)
+            print(f"🧠 Loaded {len(self.entries)} remembered answers")
+        except Exception as e:
+            print(f"⚠️ Failed to load answer memory: {e}")
+
+    def _save(self):
+        if not self.path:
+            return
+        try:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"sources_fingerprint": self.sources_fingerprint, "entries": self.entries}, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except Exception as e:
+            print(f"⚠️ Failed to save answer memory: {e}")
+
+    def flush(self):
+        """Write recorded answers to disk, if any were recorded since the last write"""
+        if self.dirty:
+            self._save()
+
+    def _index(self, key, entry):
+        self.entries[key] = entry
+        bucket = (entry['element_type'], entry['options_key'])
+        keys = self.buckets.setdefault(bucket, [])
+        if key not in keys:
+            keys.append(key)
+
+    @staticmethod
+    def make_key(question, element_type, options=None):
+        element_type = (element_type or "input").lower()
+        return f"{element_type}::{options_key(element_type, options)}::{normalize_question(question)}"
+
+    def lookup(self, question, element_type, options=None):
+        """
+        Find a remembered answer for the question, allowing near-identical wordings.
+
+        Returns:
+            The stored entry dict, or None.
+        """
+        element_type = (element_type or "input").lower()
+        entry = self.entries.get(self.make_key(question, element_type, options))
+
+        if entry is None:
+            normalized = normalize_question(question)
+            words = content_words(normalized)
+            best_ratio = 0.0
+            for key in self.buckets.get((element_type, options_key(element_type, options)), []):
+                candidate = self.entries[key]
+                if content_words(candidate['normalized_question']) != words:
+                    continue
+                ratio = difflib.SequenceMatcher(None, normalized, candidate['normalized_question']).ratio()
+                if ratio >= self.match_threshold and ratio > best_ratio:
+                    entry, best_ratio = candidate, ratio
+
+        if entry is None:
+            self.misses += 1
+            run_metrics.incr("answer_memory_misses")
+            return None
+
+        self.hits += 1
+        run_metrics.incr("answer_memory_hits")
+        return entry
+
+    def record(self, question, element_type, value, options=None, source="llm", job_url=None):
+        """Store (or re-confirm) an answer that was successfully filled"""
+        if value is None or not question:
+            return
+        element_type = (element_type or "input").lower()
+        key = self.make_key(question, element_type, options)
+        now = time.time()
+
+        entry = self.entries.get(key)
+        if entry and entry['value'] == value:
+            entry['provenance']['confirmations'] += 1
+            entry['provenance']['last_confirmed_at'] = now
+        else:
+            entry = {
+                'question': question,
+                'normalized_question': normalize_question(question),
+                'element_type': element_type,
+                'options_key': options_key(element_type, options),
+                'value': value,
+                'provenance': {
+                    'source': source,
+                    'job_url': job_url,
+                    'recorded_at': now,
+                    'last_confirmed_at': now,
+                    'confirmations': 1,
+                    'sources_fingerprint': self.sources_fingerprint
+                }
+            }
+        self._index(key, entry)
+        self.dirty = True
+
+    def invalidate(self, reason=""):
+        """Forget every remembered answer"""
+        print(f"🧠 Clearing {len(self.entries)} remembered answers{f' ({reason})' if reason else ''}")
+        self.entries = {}
+        self.buckets = {}
+        self._save()
+
+    def sync_sources(self, resume_hash, user_profile):
+        """
+        Invalidation hook: clear the memory when the resume (identified by its
+        content hash, see utils.resume_sha256) or the user profile differ from
+        the ones the stored answers were derived from.
+        """
+        digest = hashlib.sha1()
+        digest.update(str(resume_hash).encode("utf-8"))
+        profile = {k: v for k, v in (user_profile or {}).items() if k not in _PROFILE_STATE_KEYS}
+        digest.update(json.dumps(profile, sort_keys=True).encode("utf-8"))
+        fingerprint = digest.hexdigest()
+
+        if fingerprint != self.sources_fingerprint:
+            if self.entries:
+                self.invalidate("resume or user profile changed")
+            self.sources_fingerprint = fingerprint
+            self._save()
+
+
+_memory = None
+
+
+def get_answer_memory():
+    """Shared answer memory, loaded from disk on first use"""
+    global _memory
+    if _memory is None:
+        _memory = AnswerMemory()
+    return _memory
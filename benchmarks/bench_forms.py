@@ -0,0 +1,255 @@
+"""
+Offline microbenchmarks for Easy Apply form parsing and answer post-processing.
+
+Times each target on the saved modals in benchmarks/corpus and on synthetic
+modals of increasing size, and writes the results as JSON. No browser, network
+or API key is needed; the agents are created without calling __init__.
+
+    python -m benchmarks.bench_forms
+    python -m benchmarks.bench_forms --sizes 5,50 --repeat 3 --output bench_results.json
+    python -m benchmarks.bench_forms --compare bench_baseline.json
+"""
+import argparse
+import contextlib
+import glob
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from bs4 import BeautifulSoup
+from benchmarks.modal_generator import synthetic_modal
+from form_fill_agent import FormFillAgent
+from form_fill_sub_agent import FormFillSubAgent
+from form_parser import parse_easy_apply_form
+from radio import RadioIndex
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+DEFAULT_SIZES = [5, 25, 100, 500]
+DEFAULT_OUTPUT = "bench_results.json"
+
+# Slower than this much relative to the baseline counts as a regression in --compare
+DEFAULT_REGRESSION_THRESHOLD = 0.25
+
+# Each timing sample runs the target enough times to last at least this long
+MIN_SAMPLE_S = 0.05
+
+# Stop taking further samples of one target once this much time has been spent on it,
+# so the quadratic parsers at 500 fields do not dominate the run
+MAX_BENCHMARK_S = 10.0
+
+# Answer values cycled over the questions: exact option, case mismatch,
+# yes/no inference and a value matching no option
+ANSWER_VARIANTS = ["exact", "lower", "yes_phrase", "invalid"]
+
+
+def _answers_for(questions):
+    """Answers like the LLM returns them, exercising each validation path"""
+    answers = []
+    for i, q in enumerate(questions):
+        options = q.get('options') or []
+        variant = ANSWER_VARIANTS[i % len(ANSWER_VARIANTS)]
+        if not options:
+            value = "3"
+        elif variant == "exact":
+            value = options[0]
+        elif variant == "lower":
+            value = options[-1].lower()
+        elif variant == "yes_phrase":
+            value = "yes, I do"
+        else:
+            value = "not an option"
+        answers.append({
+            'element_id': q['element_id'],
+            'question': q['question'],
+            'value': value,
+            'element_type': q['element_type']
+        })
+    return answers
+
+
+def _radio_lookups(questions):
+    return [
+        (q['element_id'], (q.get('options') or [""])[-1])
+        for q in questions if q['element_type'] == 'radio'
+    ]
+
+
+def build_cases(form_agent, sub_agent, html):
+    """
+    Targets to time for one modal, as {name: zero-argument callable}.
+    Inputs each target needs (soup, questions, radio index) are prepared here, untimed.
+    """
+    parsed = parse_easy_apply_form(html)
+    questions = parsed['questions']
+    answers = _answers_for(questions)
+    soup = BeautifulSoup(html, 'html.parser')
+    elements = [e for e in soup.find_all(['input', 'select', 'textarea']) if not form_agent._should_skip_element(e)]
+    radio_index = RadioIndex.from_html(html)
+    lookups = _radio_lookups(questions)
+
+    def validate():
+        # Validation rewrites answer values, so each call gets fresh copies
+        return sub_agent._validate_answers_against_options([dict(a) for a in answers], questions)
+
+    cases = {
+        'parse_easy_apply_form': lambda: parse_easy_apply_form(html),
+        'fallback_html_parsing': lambda: form_agent._fallback_html_parsing(html),
+        'get_question_text': lambda: [form_agent._get_question_text(e) for e in elements],
+        'radio_index_from_html': lambda: RadioIndex.from_html(html),
+        'validate_answers_against_options': validate,
+    }
+    if lookups:
+        cases['radio_index_resolve'] = lambda: [radio_index.resolve(element_id, value) for element_id, value in lookups]
+
+    info = {
+        'questions': len(questions),
+        'controls': len(elements),
+        'html_kb': round(len(html) / 1024, 1)
+    }
+    return cases, info
+
+
+def measure(fn, repeat):
+    """
+    Median and best time per call in milliseconds over up to `repeat` samples.
+    Output printed by the target is discarded so it does not dominate the timing.
+    """
+    budget_started = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        loops = 1
+        while True:
+            started = time.perf_counter()
+            for _ in range(loops):
+                fn()
+            elapsed = time.perf_counter() - started
+            if elapsed >= MIN_SAMPLE_S or loops >= 1_000_000:
+                break
+            loops *= 2
+
+        samples = [elapsed / loops]
+        for _ in range(repeat - 1):
+            if time.perf_counter() - budget_started > MAX_BENCHMARK_S:
+                break
+            started = time.perf_counter()
+            for _ in range(loops):
+                fn()
+            samples.append((time.perf_counter() - started) / loops)
+
+    return {
+        'loops': loops,
+        'samples': len(samples),
+        'median_ms': round(statistics.median(samples) * 1000, 4),
+        'min_ms': round(min(samples) * 1000, 4)
+    }
+
+
+def run_benchmarks(sizes, repeat, only=None):
+    form_agent = FormFillAgent.__new__(FormFillAgent)
+    sub_agent = FormFillSubAgent.__new__(FormFillSubAgent)
+
+    inputs = [(f"corpus/{os.path.basename(path)}", None, open(path, encoding="utf-8").read())
+              for path in sorted(glob.glob(os.path.join(CORPUS_DIR, "*.html")))]
+    inputs += [(f"synthetic/{n}", n, synthetic_modal(n)) for n in sizes]
+
+    results = []
+    for input_name, fields, html in inputs:
+        cases, info = build_cases(form_agent, sub_agent, html)
+        fields = fields if fields is not None else info['questions']
+        for name, fn in cases.items():
+            if only and name not in only:
+                continue
+            timing = measure(fn, repeat)
+            result = {
+                'benchmark': name,
+                'input': input_name,
+                'fields': fields,
+                **info,
+                **timing,
+                'per_field_us': round(timing['median_ms'] * 1000 / fields, 2) if fields else None
+            }
+            results.append(result)
+            print(f"{name:<34}{input_name:<36}{timing['median_ms']:>12.3f} ms  (best {timing['min_ms']:.3f}, ×{timing['loops']})")
+    return results
+
+
+def compare(results, baseline_path, threshold):
+    """
+    Print benchmarks whose median got slower than the baseline by more than `threshold`.
+
+    Returns:
+        list of regressions as {'benchmark', 'input', 'baseline_ms', 'median_ms', 'change'}
+    """
+    with open(baseline_path) as f:
+        baseline = {(r['benchmark'], r['input']): r for r in json.load(f)['results']}
+
+    regressions = []
+    for result in results:
+        previous = baseline.get((result['benchmark'], result['input']))
+        if not previous or not previous['median_ms']:
+            continue
+        change = result['median_ms'] / previous['median_ms'] - 1
+        if change > threshold:
+            regressions.append({
+                'benchmark': result['benchmark'],
+                'input': result['input'],
+                'baseline_ms': previous['median_ms'],
+                'median_ms': result['median_ms'],
+                'change': round(change, 3)
+            })
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) over {threshold:.0%} against {baseline_path}:")
+        for r in regressions:
+            print(f"  {r['benchmark']} on {r['input']}: {r['baseline_ms']:.3f} → {r['median_ms']:.3f} ms ({r['change']:+.0%})")
+    else:
+        print(f"\n✅ No regressions over {threshold:.0%} against {baseline_path}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline form parsing microbenchmarks")
+    parser.add_argument("--sizes", default=",".join(str(n) for n in DEFAULT_SIZES),
+                        help="comma-separated synthetic modal sizes (number of questions)")
+    parser.add_argument("--repeat", type=int, default=5, help="timing samples per benchmark")
+    parser.add_argument("--only", default="", help="comma-separated benchmark names to run")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="where to write the JSON results")
+    parser.add_argument("--compare", help="earlier results file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help="relative slowdown counted as a regression (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(n) for n in args.sizes.split(",") if n.strip()]
+    only = {name.strip() for name in args.only.split(",") if name.strip()}
+
+    print("=== FORM BENCHMARKS ===")
+    started = time.time()
+    results = run_benchmarks(sizes, max(1, args.repeat), only)
+
+    report = {
+        'created_at': started,
+        'elapsed_s': round(time.time() - started, 1),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'sizes': sizes,
+        'results': results
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n📄 Wrote {len(results)} results to {args.output} ({report['elapsed_s']}s)")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+Synthetic Easy Apply modals in LinkedIn's markup: labelled text inputs,
+entity-list selects, radio and checkbox fieldsets with selectable-option
+labels, plus the phone country code select and follow-company checkbox
+that the parsers are expected to skip.
+"""
+import random
+
+JOB_ID = "4012345678"
+
+TEXT_QUESTIONS = [
+    "How many years of work experience do you have with Python?",
+    "How many years of experience do you have with SQL?",
+    "What is your notice period in days?",
+    "What is your current CTC (in lakhs per annum)?",
+    "What is your expected CTC (in lakhs per annum)?",
+    "How many years of experience do you have with Amazon Web Services (AWS)?",
+    "LinkedIn Profile",
+    "Website, blog, or portfolio",
+]
+
+SELECT_QUESTIONS = [
+    ("Are you comfortable commuting to this job's location?", ["Yes", "No"]),
+    ("What is your highest level of education?", ["High School", "Associate's Degree", "Bachelor's Degree", "Master's Degree", "Doctorate"]),
+    ("What is your level of proficiency in English?", ["None", "Conversational", "Professional", "Native or bilingual"]),
+    ("Will you now or in the future require sponsorship for employment visa status?", ["Yes", "No"]),
+]
+
+RADIO_QUESTIONS = [
+    ("Are you legally authorized to work in this country?", ["Yes", "No"]),
+    ("Have you completed the following level of education: Bachelor's Degree?", ["Yes", "No"]),
+    ("Are you willing to relocate?", ["Yes", "No", "Maybe"]),
+    ("How did you hear about this position?", ["LinkedIn", "Company website", "Referral", "Other"]),
+]
+
+CHECKBOX_QUESTIONS = [
+    ("Which of the following languages have you used professionally?", ["Python", "Java", "Go", "TypeScript", "Rust"]),
+    ("Which work arrangements are you open to?", ["On-site", "Hybrid", "Remote"]),
+    ("I agree to the terms and privacy policy", ["I agree"]),
+]
+
+COUNTRY_CODES = [
+    "India (+91)", "United States (+1)", "United Kingdom (+44)", "Canada (+1)", "Germany (+49)",
+    "France (+33)", "Australia (+61)", "Singapore (+65)", "United Arab Emirates (+971)", "Netherlands (+31)",
+    "Ireland (+353)", "Spain (+34)", "Italy (+39)", "Japan (+81)", "Brazil (+55)",
+]
+
+FIELD_KINDS = ["text", "select", "radio", "checkbox"]
+
+
+def _element_urn(question_number, suffix):
+    return f"formElement-urn-li-jobs-applyformcommon-easyApplyFormElement-{JOB_ID}-{question_number}-{suffix}"
+
+
+def _urn_name(question_number, suffix):
+    return f"urn:li:fsd_formElement:urn:li:jobs_applyformcommon_easyApplyFormElement:({JOB_ID},{question_number},{suffix})"
+
+
+def _label_text(text):
+    return (f'<span aria-hidden="true"><!---->{text}<!----></span>'
+            f'<span class="visually-hidden"><!---->{text}<!----></span>')
+
+
+def text_field(question_number, question, suffix="numeric"):
+    element_id = f"single-line-text-form-component-{_element_urn(question_number, suffix)}"
+    return f"""
+<div class="jobs-easy-apply-form-section__grouping">
+  <div class="jobs-easy-apply-form-element" data-test-single-line-text-form-component="">
+    <div class="artdeco-text-input--container ember-view">
+      <label for="{element_id}" class="artdeco-text-input--label">{question}</label>
+      <input class="artdeco-text-input--input" id="{element_id}" required="" aria-describedby="{element_id}-error" type="text">
+    </div>
+    <div id="{element_id}-error"></div>
+  </div>
+</div>"""
+
+
+def select_field(question_number, question, options, suffix="multipleChoice"):
+    element_id = f"text-entity-list-form-component-{_element_urn(question_number, suffix)}"
+    option_html = "".join(f'<option value="{o}">{o}</option>' for o in ["Select an option"] + list(options))
+    return f"""
+<div class="jobs-easy-apply-form-section__grouping">
+  <div class="jobs-easy-apply-form-element" data-test-text-entity-list-form-component="">
+    <label for="{element_id}" class="fb-dash-form-element__label">{_label_text(question)}</label>
+    <select id="{element_id}" aria-required="true" data-test-text-entity-list-form-select="">{option_html}</select>
+  </div>
+</div>"""
+
+
+def _selectable_fieldset(component, input_type, question_number, question, options):
+    fieldset_id = f"{component}-{_element_urn(question_number, 'multipleChoice')}"
+    name = _urn_name(question_number, "multipleChoice")
+    option_html = []
+    for i, option in enumerate(options):
+        input_id = f"{name}-{i}" if input_type == "radio" else f"{fieldset_id}-{i}"
+        option_html.append(f"""
+    <div data-test-text-selectable-option="{i}" class="fb-text-selectable__option display-flex">
+      <input name="{name}" id="{input_id}" type="{input_type}" value="{option}" data-test-text-selectable-option__input="{option}" class="fb-form-element__checkbox">
+      <label for="{input_id}" data-test-text-selectable-option__label="{option}" class="t-14">{option}</label>
+    </div>""")
+    return f"""
+<div class="jobs-easy-apply-form-section__grouping">
+  <fieldset id="{fieldset_id}" data-test-form-builder-{component}="true">
+    <legend><div class="fb-dash-form-element__label">{_label_text(question)}</div></legend>{''.join(option_html)}
+  </fieldset>
+</div>"""
+
+
+def radio_field(question_number, question, options):
+    return _selectable_fieldset("radio-button-form-component", "radio", question_number, question, options)
+
+
+def checkbox_field(question_number, question, options):
+    return _selectable_fieldset("checkbox-form-component", "checkbox", question_number, question, options)
+
+
+def phone_country_code_field(question_number=2):
+    return select_field(question_number, "Phone country code", COUNTRY_CODES, suffix="phoneNumber-country")
+
+
+def follow_company_field(company="Acme Corp"):
+    return f"""
+<div class="job-details-easy-apply-footer__section">
+  <input id="follow-company-checkbox" type="checkbox" class="ember-checkbox ember-view" checked="">
+  <label for="follow-company-checkbox">Follow {company} to stay up to date with their page.</label>
+</div>"""
+
+
+def wrap_modal(title, body, progress=50, footer_buttons=("Back", "Review")):
+    buttons = "".join(
+        f'<button aria-label="{b} your application" class="artdeco-button artdeco-button--2" type="button"><span class="artdeco-button__text">{b}</span></button>'
+        for b in footer_buttons
+    )
+    return f"""<div class="jobs-easy-apply-modal__content" data-test-modal-content="">
+<form novalidate="">
+  <input type="hidden" name="csrfToken" value="ajax:0123456789">
+  <div class="ph5">
+    <div class="jobs-easy-apply-content">
+      <h3 class="t-16 t-bold">{title}</h3>
+      <progress max="100" value="{progress}" class="artdeco-completeness-meter-linear__progress-element"></progress>{body}
+    </div>
+  </div>
+  <footer role="presentation"><div class="display-flex justify-flex-end ph5 pv4">{buttons}</div></footer>
+</form>
+</div>"""
+
+
+def synthetic_modal(n_fields, kinds=FIELD_KINDS, seed=0):
+    """
+    A modal step with `n_fields` questions cycling through `kinds`, preceded by
+    the phone country code select and followed by the follow-company checkbox.
+
+    Returns:
+        HTML string of the modal content
+    """
+    rng = random.Random(seed)
+    fields = [phone_country_code_field()]
+    for i in range(n_fields):
+        question_number = 100 + i
+        kind = kinds[i % len(kinds)]
+        if kind == "text":
+            fields.append(text_field(question_number, rng.choice(TEXT_QUESTIONS)))
+        elif kind == "select":
+            question, options = rng.choice(SELECT_QUESTIONS)
+            fields.append(select_field(question_number, question, options))
+        elif kind == "radio":
+            question, options = rng.choice(RADIO_QUESTIONS)
+            fields.append(radio_field(question_number, question, options))
+        else:
+            question, options = rng.choice(CHECKBOX_QUESTIONS)
+            fields.append(checkbox_field(question_number, question, options))
+    fields.append(follow_company_field())
+    return wrap_modal("Additional Questions", "".join(fields))
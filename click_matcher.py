@@ -0,0 +1,110 @@
+# Attribute set on the element chosen by MATCH_CLICK_TARGET_JS so Playwright can click it
+CLICK_TARGET_ATTR = "data-agent-click-target"
+CLICK_TARGET_SELECTOR = f"[{CLICK_TARGET_ATTR}]"
+
+# Third-party sign-in buttons the agent must never click on a substring match
+SSO_MARKERS = ['apple', 'google', 'facebook', 'microsoft', 'sso', 'continue with']
+
+# Ranks the page's buttons or links against an identifier in one in-page pass and
+# marks the best one. Lower rank wins; visible elements win over hidden ones.
+MATCH_CLICK_TARGET_JS = """
+({kind, identifier, attr, ssoMarkers}) => {
+    document.querySelectorAll('[' + attr + ']').forEach(el => el.removeAttribute(attr));
+
+    const elements = Array.from(document.querySelectorAll(kind === 'link' ? 'a' : 'button'));
+    const wanted = identifier.trim().toLowerCase();
+
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        if (rect.width === 0 || rect.height === 0) return false;
+        return window.getComputedStyle(el).visibility !== 'hidden';
+    };
+    const textOf = (el) => (el.textContent || '').trim();
+
+    const rankButton = (el) => {
+        const text = textOf(el).toLowerCase();
+        const aria = (el.getAttribute('aria-label') || '').toLowerCase();
+        if (text && text === wanted) return [0, 'exact_text'];
+
+        const textMatch = text && text.includes(wanted);
+        const ariaMatch = aria && aria.includes(wanted);
+        if (!textMatch && !ariaMatch) return null;
+        if (ssoMarkers.some(marker => text.includes(marker) || aria.includes(marker))) return null;
+
+        // Easy Apply filter button in the search sidebar (role=radio)
+        const id = el.getAttribute('id') || '';
+        const role = el.getAttribute('role') || '';
+        if (role === 'radio' && (text.includes('easy apply') || aria.includes('easy apply') || id.includes('searchFilter_applyWithLinkedin'))) {
+            return [1, 'easy_apply_filter'];
+        }
+        // Job detail page Easy Apply button (text is nested in a span)
+        if (wanted === 'easy apply') {
+            const span = el.querySelector('span.artdeco-button__text');
+            if (span && (span.innerText || span.textContent || '').toLowerCase().includes('easy apply')) {
+                return [2, 'easy_apply_button'];
+            }
+        }
+        return textMatch ? [3, 'substring'] : [4, 'aria_label'];
+    };
+
+    const rankLink = (el) => {
+        const text = textOf(el).toLowerCase();
+        const href = el.getAttribute('href') || '';
+        const aria = (el.getAttribute('aria-label') || '').toLowerCase();
+        if (text && text === wanted) return [0, 'exact_text'];
+        if (text && text.includes(wanted)) return [1, 'substring'];
+        if (href && href.includes(identifier)) return [2, 'href'];
+        if (aria && aria.includes(wanted)) return [3, 'aria_label'];
+        return null;
+    };
+
+    let candidates = [];
+    if (/^\\d+$/.test(identifier)) {
+        // Same 1-based, page-wide numbering as the 'index' field of dom_snapshot
+        const position = parseInt(identifier, 10) - 1;
+        const el = elements[position];
+        if (el) candidates.push({el, position, rank: 0, rule: 'index', visible: isVisible(el)});
+    } else {
+        const rank = kind === 'link' ? rankLink : rankButton;
+        elements.forEach((el, position) => {
+            const match = rank(el);
+            if (match) candidates.push({el, position, rank: match[0], rule: match[1], visible: isVisible(el)});
+        });
+        candidates.sort((a, b) => (b.visible - a.visible) || (a.rank - b.rank) || (a.position - b.position));
+    }
+
+    if (!candidates.length) return {found: false, scanned: elements.length, candidates: []};
+
+    candidates[0].el.setAttribute(attr, '1');
+    const describe = (c) => ({
+        text: textOf(c.el).slice(0, 80),
+        href: c.el.getAttribute('href'),
+        rule: c.rule,
+        position: c.position,
+        visible: c.visible
+    });
+    return {
+        found: true,
+        scanned: elements.length,
+        best: describe(candidates[0]),
+        candidates: candidates.slice(0, 5).map(describe)
+    };
+}
+"""
+
+
+async def find_click_target(page, element_type, identifier):
+    """
+    Find and mark the best button or link for an identifier (text, aria-label,
+    href fragment or numeric index) with a single evaluate call.
+
+    Returns:
+        dict with 'found', 'scanned', and when found 'best' plus a ranked
+        'candidates' short list. The chosen element matches CLICK_TARGET_SELECTOR.
+    """
+    return await page.evaluate(MATCH_CLICK_TARGET_JS, {
+        'kind': 'link' if element_type == 'link' else 'button',
+        'identifier': str(identifier),
+        'attr': CLICK_TARGET_ATTR,
+        'ssoMarkers': SSO_MARKERS
+    })
@@ -7,6 +7,8 @@ load_dotenv()
 TARGET_URL = "https://www.linkedin.com"
 GEMINI_API_KEY = os.getenv("GOOGLE_API_KEY")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash-preview-04-17")
+LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE", "0.1"))
 LINKEDIN_EMAIL = os.getenv("LINKEDIN_EMAIL")
 LINKEDIN_PASSWORD = os.getenv("LINKEDIN_PASS")
 JOB_TITLE = "Data Scientist"
@@ -15,7 +17,149 @@ JOB_LOCATION = "Bangalore, India"
 PHONE_NUMNER = "7046281329"
 RESUME_PATH = "/home/neel/Desktop/HyperLink/Automatic_Job_Selection/Linked_IN/Agents/resume college 1.pdf"
 
-def format_linkedin_job_url(base_url, job_title, location, easy_apply=True):
+# Page readiness: wait on concrete page conditions with short bounded timeouts.
+# POLITE_MODE restores the old fixed pauses between actions on top of those waits.
+POLITE_MODE = os.getenv("POLITE_MODE", "false").lower() in ["1", "true", "yes"]
+READY_TIMEOUT_MS = int(os.getenv("READY_TIMEOUT_MS", "8000"))
+# LinkedIn keeps long-polling connections open, so networkidle rarely settles;
+# it is only awaited where a caller opts in (error recovery), and only this long
+NETWORK_QUIET_TIMEOUT_MS = int(os.getenv("NETWORK_QUIET_TIMEOUT_MS", "500"))
+# How long a clicked link gets to change the page URL before the click is treated as in-page
+LINK_NAVIGATION_TIMEOUT_MS = int(os.getenv("LINK_NAVIGATION_TIMEOUT_MS", "3000"))
+
+# Browser launch profiles, selected with BROWSER_PROFILE
+BROWSER_PROFILES = {
+    # Visible window with slowed-down actions, for watching and debugging runs
+    "interactive": {
+        "headless": False,
+        "slow_mo": 1000,
+        "viewport": None,
+        "args": []
+    },
+    # No window and no slow_mo, for throughput runs on servers
+    "headless_fast": {
+        "headless": True,
+        "slow_mo": 0,
+        "viewport": {"width": 1280, "height": 800},
+        "args": []
+    },
+    # Headless with a reduced viewport and GPU/extension features disabled
+    "headless_lite": {
+        "headless": True,
+        "slow_mo": 0,
+        "viewport": {"width": 1024, "height": 720},
+        "args": ["--disable-gpu", "--disable-dev-shm-usage", "--disable-extensions", "--mute-audio"]
+    }
+}
+BROWSER_PROFILE = os.getenv("BROWSER_PROFILE", "interactive")
+
+# Number of job applications run concurrently, each on its own page
+MAX_CONCURRENT_APPLICATIONS = int(os.getenv("MAX_CONCURRENT_APPLICATIONS", "2"))
+
+# Allow console prompts for manual steps (verification, resume upload, unanswered
+# fields). They are only used with a visible browser, and during applications only
+# with one job in flight (PIPELINE_PAGES=1 for the pipeline runner,
+# MAX_CONCURRENT_APPLICATIONS=1 for workers); otherwise fields are skipped and the
+# job is marked needs_manual.
+MANUAL_INPUT_PROMPTS = os.getenv("MANUAL_INPUT_PROMPTS", "true").lower() in ["1", "true", "yes"]
+
+# Saved Playwright storage state (cookies + local storage) of a logged-in session.
+# Contains session cookies, so keep it out of version control.
+STORAGE_STATE_PATH = os.getenv("STORAGE_STATE_PATH", "linkedin_storage_state.json")
+
+# Parsed Easy Apply questions cached per form template
+FORM_TEMPLATE_CACHE_PATH = os.getenv("FORM_TEMPLATE_CACHE_PATH", "form_template_cache.json")
+FORM_TEMPLATE_CACHE_SIZE = int(os.getenv("FORM_TEMPLATE_CACHE_SIZE", "500"))
+
+# Confirmed question -> answer pairs reused across jobs
+ANSWER_MEMORY_PATH = os.getenv("ANSWER_MEMORY_PATH", "answer_memory.json")
+ANSWER_MEMORY_MATCH_THRESHOLD = float(os.getenv("ANSWER_MEMORY_MATCH_THRESHOLD", "0.92"))
+
+# Extracted resume text, cached on disk by file content hash
+RESUME_CACHE_DIR = os.getenv("RESUME_CACHE_DIR", ".cache/resume")
+
+# Ask the LLM to pick job links only when the local harvester finds none
+JOB_LINK_LLM_FALLBACK = os.getenv("JOB_LINK_LLM_FALLBACK", "false").lower() in ["1", "true", "yes"]
+
+# Minimum share of recognised form controls for the native form parser's
+# result to be used without asking the LLM
+FORM_PARSER_MIN_CONFIDENCE = float(os.getenv("FORM_PARSER_MIN_CONFIDENCE", "1.0"))
+
+# Token budget for the page elements pasted into tool-use prompts (estimated at
+# ~4 characters per token) and the max length kept for each element's text
+PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "1500"))
+PROMPT_TEXT_MAX_CHARS = int(os.getenv("PROMPT_TEXT_MAX_CHARS", "80"))
+
+# Paginated job discovery: stop after DISCOVERY_MAX_JOBS job links or
+# DISCOVERY_MAX_PAGES result pages of DISCOVERY_PAGE_SIZE jobs each
+DISCOVERY_MAX_JOBS = int(os.getenv("DISCOVERY_MAX_JOBS", "100"))
+DISCOVERY_MAX_PAGES = int(os.getenv("DISCOVERY_MAX_PAGES", "40"))
+DISCOVERY_PAGE_SIZE = int(os.getenv("DISCOVERY_PAGE_SIZE", "25"))
+
+# Ledger of processed jobs. Jobs with a status in LEDGER_SKIP_STATUSES, or that
+# have failed LEDGER_MAX_ATTEMPTS times, are skipped by job discovery. Only
+# completed applications are skipped by default; failures are retried.
+JOB_LEDGER_PATH = os.getenv("JOB_LEDGER_PATH", "job_ledger.sqlite3")
+LEDGER_SKIP_STATUSES = [s.strip() for s in os.getenv("LEDGER_SKIP_STATUSES", "applied").split(",") if s.strip()]
+LEDGER_MAX_ATTEMPTS = int(os.getenv("LEDGER_MAX_ATTEMPTS", "2"))
+
+# Application runner: "pipeline" (staged, see pipeline.py) or "workers" (one
+# worker runs each job start to finish). PIPELINE_PAGES is the number of browser
+# pages (jobs in flight); each stage has its own concurrency and a bounded
+# input queue of PIPELINE_QUEUE_SIZE jobs.
+APPLICATION_RUNNER = os.getenv("APPLICATION_RUNNER", "pipeline")
+PIPELINE_PAGES = int(os.getenv("PIPELINE_PAGES", str(MAX_CONCURRENT_APPLICATIONS + 1)))
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "2"))
+PIPELINE_STAGE_CONCURRENCY = {
+    "load": int(os.getenv("PIPELINE_LOAD_CONCURRENCY", "2")),
+    "extract": int(os.getenv("PIPELINE_EXTRACT_CONCURRENCY", "2")),
+    "answer": int(os.getenv("PIPELINE_ANSWER_CONCURRENCY", "3")),
+    "submit": int(os.getenv("PIPELINE_SUBMIT_CONCURRENCY", "2"))
+}
+
+# Shared LLM gateway limits; set the per-minute limits to your Gemini quota.
+# Token usage is estimated up front (prompt + expected output) and corrected
+# from the response's usage metadata.
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "30"))
+LLM_TOKENS_PER_MINUTE = int(os.getenv("LLM_TOKENS_PER_MINUTE", "250000"))
+LLM_EXPECTED_OUTPUT_TOKENS = int(os.getenv("LLM_EXPECTED_OUTPUT_TOKENS", "256"))
+
+# LLM call resilience: deadline per call type (seconds), retries with jittered
+# exponential backoff, a hedged second request for idempotent call types that
+# have not answered after LLM_HEDGE_AFTER_S, and a circuit breaker that switches
+# to deterministic paths after LLM_BREAKER_FAILURES consecutive failures.
+LLM_DEADLINES = {
+    "page_action": 30,
+    "job_navigation": 20,
+    "link_filter": 30,
+    "easy_apply_click": 20,
+    "question_extraction": 45,
+    "answer_generation": 60,
+    "field_fill": 20,
+    "form_submission": 20
+}
+LLM_DEFAULT_DEADLINE_S = float(os.getenv("LLM_DEFAULT_DEADLINE_S", "30"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))
+LLM_RETRY_BASE_S = float(os.getenv("LLM_RETRY_BASE_S", "1.0"))
+LLM_RETRY_MAX_S = float(os.getenv("LLM_RETRY_MAX_S", "10"))
+LLM_HEDGE_CALL_TYPES = ["question_extraction", "answer_generation"]
+LLM_HEDGE_AFTER_S = float(os.getenv("LLM_HEDGE_AFTER_S", "15"))
+LLM_BREAKER_FAILURES = int(os.getenv("LLM_BREAKER_FAILURES", "5"))
+LLM_BREAKER_COOLDOWN_S = float(os.getenv("LLM_BREAKER_COOLDOWN_S", "120"))
+
+RUN_METRICS_PATH = os.getenv("RUN_METRICS_PATH", "run_metrics.jsonl")
+
+# Timed spans for stages, LLM calls, tool calls and DOM snapshots, appended to
+# TRACE_PATH as JSON lines every TRACE_FLUSH_EVERY spans and at the end of the run
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "true").lower() in ["1", "true", "yes"]
+TRACE_PATH = os.getenv("TRACE_PATH", "traces.jsonl")
+TRACE_FLUSH_EVERY = int(os.getenv("TRACE_FLUSH_EVERY", "200"))
+
+# Content container of the Easy Apply dialog; holds the form and its Next/Review/Submit footer
+EASY_APPLY_MODAL_SELECTOR = "div.jobs-easy-apply-modal__content"
+
+def format_linkedin_job_url(base_url, job_title, location, easy_apply=True, start=0):
     """
     Format LinkedIn job search URL with proper URL encoding
     
@@ -24,6 +168,7 @@ def format_linkedin_job_url(base_url, job_title, location, easy_apply=True):
         job_title (str): Job title to search for
         location (str): Location to search in
         easy_apply (bool): Whether to filter for Easy Apply jobs
+        start (int): Result offset for pagination (LinkedIn pages hold 25 jobs)
     
     Returns:
         str: Formatted LinkedIn job search URL
@@ -39,6 +184,8 @@ def format_linkedin_job_url(base_url, job_title, location, easy_apply=True):
         params.append("f_AL=true")  # Easy Apply filter
     params.append(f"keywords={encoded_keywords}")
     params.append(f"location={encoded_location}")
+    if start:
+        params.append(f"start={start}")
 
     query_string = "&".join(params)
     
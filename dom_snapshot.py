@@ -0,0 +1,126 @@
+import time
+from tracing import get_tracer
+
+# Collects links, buttons and inputs under `root` in a single in-page pass.
+# Mirrors the per-element Playwright calls get_page_elements used to make:
+# text_content(), get_attribute(), is_visible() and is_enabled().
+# Indices are 1-based positions among all of the page's links/buttons/inputs,
+# also for a scoped snapshot, since click_element resolves index identifiers
+# against the whole page.
+SNAPSHOT_JS = """
+(root) => {
+    const started = performance.now();
+    let visited = 0;
+
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        if (rect.width === 0 || rect.height === 0) return false;
+        return window.getComputedStyle(el).visibility !== 'hidden';
+    };
+
+    const scoped = root !== document.documentElement;
+    const pagePositions = (selector) => {
+        if (!scoped) return null;
+        const positions = new Map();
+        document.querySelectorAll(selector).forEach((el, i) => positions.set(el, i + 1));
+        return positions;
+    };
+    const linkPositions = pagePositions('a');
+    const buttonPositions = pagePositions('button');
+    const inputPositions = pagePositions('input');
+
+    const links = [];
+    const seenHrefs = new Set();
+    root.querySelectorAll('a').forEach((el, i) => {
+        visited++;
+        const href = (el.getAttribute('href') || '').trim();
+        if (!href || href.startsWith('javascript:') || seenHrefs.has(href)) return;
+        seenHrefs.add(href);
+        links.push({
+            index: linkPositions ? linkPositions.get(el) : i + 1,
+            text: (el.textContent || '').trim(),
+            href: href,
+            visible: isVisible(el),
+            target: el.getAttribute('target'),
+            rel: el.getAttribute('rel')
+        });
+    });
+
+    const buttons = [];
+    root.querySelectorAll('button').forEach((el, i) => {
+        visited++;
+        const text = (el.textContent || '').trim();
+        if (!text) return;
+        buttons.push({
+            index: buttonPositions ? buttonPositions.get(el) : i + 1,
+            text: text,
+            onclick: el.getAttribute('onclick'),
+            class: el.getAttribute('class'),
+            visible: isVisible(el)
+        });
+    });
+
+    const inputs = [];
+    root.querySelectorAll('input').forEach((el, i) => {
+        visited++;
+        inputs.push({
+            index: inputPositions ? inputPositions.get(el) : i + 1,
+            type: el.getAttribute('type'),
+            placeholder: el.getAttribute('placeholder'),
+            name: el.getAttribute('name'),
+            id: el.getAttribute('id'),
+            visible: isVisible(el),
+            enabled: !el.matches(':disabled')
+        });
+    });
+
+    return {
+        page_title: document.title,
+        buttons: buttons,
+        links: links,
+        inputs: inputs,
+        nodes_visited: visited,
+        in_page_ms: performance.now() - started
+    };
+}
+"""
+
+
+async def take_dom_snapshot(page, root=None):
+    """
+    Snapshot all links, buttons and inputs on the page with one evaluate call.
+
+    Args:
+        page: Playwright page to snapshot.
+        root: Optional CSS selector or Locator. When given, only elements
+              inside that subtree are collected.
+
+    Returns:
+        dict with 'page_title', 'buttons', 'links', 'inputs' and a
+        'snapshot_stats' entry holding timing and node counts.
+    """
+    if root is None:
+        target = page.locator(":root")
+    elif isinstance(root, str):
+        target = page.locator(root).first
+    else:
+        target = root.first
+
+    started = time.perf_counter()
+    with get_tracer().span("dom.snapshot", scoped=root is not None) as span:
+        data = await target.evaluate(SNAPSHOT_JS, timeout=5000)
+        span.set(
+            buttons=len(data.get('buttons', [])),
+            links=len(data.get('links', [])),
+            inputs=len(data.get('inputs', [])),
+            nodes_visited=data.get('nodes_visited', 0)
+        )
+    round_trip_ms = (time.perf_counter() - started) * 1000
+
+    data['snapshot_stats'] = {
+        'duration_ms': round(round_trip_ms, 1),
+        'in_page_ms': round(data.pop('in_page_ms', 0.0), 1),
+        'nodes_visited': data.pop('nodes_visited', 0),
+        'scoped': root is not None
+    }
+    return data
@@ -2,8 +2,13 @@ import asyncio
 import json
 import re
 from langchain_core.messages import HumanMessage, SystemMessage
-from tools import create_tools
-from config import RESUME_PATH
+from tool_registry import get_bound_model, get_tool, invoke_tool
+from config import RESUME_PATH, EASY_APPLY_MODAL_SELECTOR, FORM_PARSER_MIN_CONFIDENCE
+from readiness import wait_for_selectors, polite_pause
+from form_template_cache import get_form_template_cache
+from form_parser import parse_easy_apply_form
+from llm_resilience import llm_invoke, llm_available
+from tracing import get_tracer
 
 class FormFillAgent:
 
@@ -12,15 +17,15 @@ class FormFillAgent:
         self.llm_model = llm_model
 
         # Only use click_element tool for now
-        self.tools = create_tools(navigator, RESUME_PATH)
-        self.model_with_tools = llm_model.bind_tools(self.tools)
+        self.model_with_tools = get_bound_model(llm_model)
 
         self.last_extracted_questions = []
+        self.last_extraction_source = None
 
     async def get_current_page_state(self):
         """Get elements and HTML for Easy Apply modal if loaded"""
         try:
-            elements = await self.navigator.get_page_elements()
+            elements = await self.navigator.get_form_step_elements()
             form_html = await self.navigator.extract_easy_apply_modal_html()
             return {
                 **elements,
@@ -28,7 +33,7 @@ class FormFillAgent:
             }
         except Exception as e:
             print(f"❌ Error extracting page state: {e}")
-            return await self.navigator.get_page_elements()
+            return await self.navigator.get_form_step_elements()
 
     async def apply_to_job(self):
         """Full flow: Click Easy Apply -> Wait -> Extract Questions"""
@@ -48,8 +53,8 @@ class FormFillAgent:
         - If form loads, proceed to extract questions from it in the next step
         """)
 
-        # Load page elements
-        page_state = await self.navigator.get_page_elements()
+        # Load page elements (scoped to the modal if it is already open)
+        page_state = await self.navigator.get_form_step_elements()
 
         # Create human message context with buttons
         human_message = HumanMessage(content=f"""
@@ -63,32 +68,42 @@ class FormFillAgent:
         """)
 
         try:
-            response = await self.model_with_tools.ainvoke([system_message, human_message])
-
-            # Ensure tool call
-            if response.tool_calls:
-                click_call = response.tool_calls[0]
-                tool_name = click_call['name']
-                tool_args = click_call['args']
-
-                tool = next((t for t in self.tools if t.name == tool_name), None)
-                if tool:
-                    print(f"🖱️ Clicking Easy Apply with args: {tool_args}")
-                    await tool.ainvoke(tool_args)
-                    print("✅ Easy Apply clicked.")
-                else:
-                    print(f"❌ Tool {tool_name} not found")
-                    return "tool_not_found"
+            if not llm_available():
+                # Deterministic path: click_element already knows the Easy Apply button variants
+                result = await invoke_tool(self.navigator, "click_element", {"element_type": "button", "identifier": "Easy Apply"})
+                if not str(result).startswith("Successfully"):
+                    print(f"❌ Easy Apply button not found: {result}")
+                    return "click_error"
+                print("✅ Easy Apply clicked.")
             else:
-                print("⚠️ LLM did not make a tool call to click Easy Apply")
-                return "no_tool_call"
+                response = await llm_invoke(self.model_with_tools, [system_message, human_message], "easy_apply_click")
+
+                # Ensure tool call
+                if response.tool_calls:
+                    click_call = response.tool_calls[0]
+                    tool_name = click_call['name']
+                    tool_args = click_call['args']
+
+                    if get_tool(tool_name):
+                        print(f"🖱️ Clicking Easy Apply with args: {tool_args}")
+                        await invoke_tool(self.navigator, tool_name, tool_args)
+                        print("✅ Easy Apply clicked.")
+                    else:
+                        print(f"❌ Tool {tool_name} not found")
+                        return "tool_not_found"
+                else:
+                    print("⚠️ LLM did not make a tool call to click Easy Apply")
+                    return "no_tool_call"
 
         except Exception as e:
             print(f"❌ Error during Easy Apply click: {e}")
             return "click_error"
 
         # Wait for modal to load
-        await asyncio.sleep(2)
+        if not await wait_for_selectors(self.navigator.page, EASY_APPLY_MODAL_SELECTOR):
+            print("❌ Easy Apply modal did not open")
+            return "modal_not_open"
+        await polite_pause(2)
 
         # Extract updated form state
         page_state = await self.get_current_page_state()
@@ -113,19 +128,70 @@ class FormFillAgent:
             
             return "questions_extracted"
 
+        if self.last_extraction_source is None:
+            print("❌ Could not extract questions from the Easy Apply form.")
+            return "extraction_failed"
+
         print("⚠️ No questions found in form after clicking Easy Apply.")
         return "no_questions"
 
     async def extract_questions_only(self, page_state):
-        """Extract form questions from modal HTML with multiple fallback methods"""
+        """
+        Extract form questions from modal HTML with multiple fallback methods.
+        last_extraction_source stays None if no method produced a result.
+        """
+        self.last_extraction_source = None
         form_html = page_state.get("form_html", "")
         
         if not form_html:
             print("⚠️ No form HTML found")
             return []
 
+        # Native parser first; the cache and LLM only handle forms it is unsure about
+        try:
+            with get_tracer().span("parse.easy_apply_form", html_chars=len(form_html)) as span:
+                parsed = parse_easy_apply_form(form_html)
+                span.set(questions=len(parsed['questions']), confidence=parsed['confidence'])
+        except Exception as e:
+            print(f"⚠️ Native form parsing failed: {e}")
+            parsed = {'questions': [], 'confidence': 0.0, 'unknown_components': []}
+
+        if parsed['questions'] and parsed['confidence'] >= FORM_PARSER_MIN_CONFIDENCE and not parsed['unknown_components']:
+            print(f"⚡ Native parser extracted {len(parsed['questions'])} form elements")
+            self.last_extraction_source = "parser"
+            self.last_extracted_questions = self._validate_and_clean_elements(parsed['questions'])
+            return self.last_extracted_questions
+
+        if not parsed['questions'] and parsed['confidence'] >= 1.0 and not parsed['unknown_components']:
+            # Every control was recognised and none needs an answer (e.g. a review step)
+            print("⚡ Native parser found no questions to answer")
+            self.last_extraction_source = "parser"
+            self.last_extracted_questions = []
+            return self.last_extracted_questions
+
+        print(f"🔎 Native parser confidence {parsed['confidence']:.2f}, unknown components: {parsed['unknown_components']}")
+
+        template_cache = get_form_template_cache()
+        cached_questions = template_cache.lookup(form_html)
+        if cached_questions is not None:
+            self.last_extraction_source = "cache"
+            self.last_extracted_questions = cached_questions
+            return self.last_extracted_questions
+
+        if not llm_available():
+            # Provider degraded: take the parser's best effort, then the HTML heuristics
+            print("🔴 LLM unavailable, using deterministic question extraction")
+            self.last_extraction_source = "fallback"
+            if parsed['questions']:
+                self.last_extracted_questions = self._validate_and_clean_elements(parsed['questions'])
+            else:
+                self.last_extracted_questions = self._fallback_html_parsing(form_html)
+            return self.last_extracted_questions
+
         try:
             self.last_extracted_questions = await self.extract_questions_with_llm(form_html)
+            if self.last_extracted_questions and self.last_extraction_source == "llm":
+                template_cache.store(form_html, self.last_extracted_questions)
             return self.last_extracted_questions
 
         except Exception as e:
@@ -189,7 +255,7 @@ class FormFillAgent:
         human_message = HumanMessage(content=f"HTML to analyze:\n{form_html}")
         
         try:
-            response = await self.llm_model.ainvoke([system_message, human_message])
+            response = await llm_invoke(self.llm_model, [system_message, human_message], "question_extraction")
             response_content = response.content.strip()
             
             # Try JSON extraction
@@ -201,6 +267,7 @@ class FormFillAgent:
                     if isinstance(form_elements, list):
                         # Validate and clean the extracted elements
                         cleaned_elements = self._validate_and_clean_elements(form_elements)
+                        self.last_extraction_source = "llm"
                         print(f"✅ LLM extracted {len(cleaned_elements)} form elements")
                         return cleaned_elements
                 except json.JSONDecodeError as e:
@@ -210,12 +277,18 @@ class FormFillAgent:
             # Enhanced fallback with basic HTML parsing
             form_elements = self._fallback_html_parsing(form_html)
             if form_elements:
+                self.last_extraction_source = "fallback"
                 print(f"✅ Fallback HTML parsing extracted {len(form_elements)} elements")
                 return form_elements
                 
         except Exception as e:
             print(f"❌ Unexpected error during LLM extraction: {e}")
-            return []
+            # The model call failed (deadline, retries exhausted or breaker open)
+            form_elements = self._fallback_html_parsing(form_html)
+            if form_elements:
+                self.last_extraction_source = "fallback"
+                print(f"✅ Fallback HTML parsing extracted {len(form_elements)} elements")
+            return form_elements
 
     def _validate_and_clean_elements(self, elements):
         """Validate and clean extracted form elements"""
@@ -4,7 +4,9 @@ import os
 import asyncio
 from config import RESUME_PATH
 from langchain_core.messages import SystemMessage, HumanMessage
-from utils import extract_text_from_resume
+from utils import extract_text_from_resume_async, resume_sha256_async
+from answer_memory import get_answer_memory
+from llm_resilience import llm_invoke, llm_available
 
 
 class FormFillSubAgent:
@@ -28,7 +30,7 @@ class FormFillSubAgent:
         
         print("\n📖 Step 1: Extracting resume content...")
         try:
-            resume_text = extract_text_from_resume(self.resume_path)
+            resume_text = await extract_text_from_resume_async(self.resume_path)
             print(f"✅ Resume extracted successfully ({len(resume_text)} characters)")
         except Exception as e:
             print(f"❌ Error reading resume: {e}")
@@ -44,6 +46,51 @@ class FormFillSubAgent:
         return answers, True
 
     async def _generate_answers(self, questions, resume_text):
+        """Answer from the local answer memory first, asking the LLM only for the misses"""
+        memory = get_answer_memory()
+        try:
+            resume_hash = await resume_sha256_async(self.resume_path)
+        except Exception:
+            resume_hash = self.resume_path
+        memory.sync_sources(resume_hash, self.user_profile)
+
+        remembered = {}
+        misses = []
+        for q in questions:
+            entry = memory.lookup(q.get('question'), q.get('element_type'), q.get('options'))
+            if entry is not None:
+                remembered[q.get('element_id')] = {
+                    "element_id": q.get('element_id'),
+                    "question": q.get('question'),
+                    "value": entry['value'],
+                    "element_type": q.get('element_type', 'input').lower(),
+                    "source": "memory"
+                }
+            else:
+                misses.append(q)
+
+        print(f"🧠 Answer memory: {len(remembered)} remembered, {len(misses)} to ask the LLM")
+
+        if misses and not llm_available():
+            # Unanswered questions are left for manual input rather than waiting on a degraded provider
+            print(f"🔴 LLM unavailable, leaving {len(misses)} question(s) unanswered")
+            misses = []
+        generated = await self._generate_answers_with_llm(misses, resume_text) if misses else []
+        generated_by_id = {a.get('element_id'): a for a in generated if isinstance(a, dict)}
+
+        # Keep the question order and attach options so confirmed answers can be written back
+        answers = []
+        for q in questions:
+            answer = remembered.get(q.get('element_id')) or generated_by_id.pop(q.get('element_id'), None)
+            if answer is None:
+                continue
+            answer.setdefault("source", "llm")
+            answer.setdefault("options", q.get('options'))
+            answers.append(answer)
+        answers.extend(generated_by_id.values())
+        return answers
+
+    async def _generate_answers_with_llm(self, questions, resume_text):
         """Generate answers using LLM with enhanced options handling"""
         print("🤖 Asking LLM to generate answers...")
         
@@ -175,7 +222,7 @@ class FormFillSubAgent:
         }, indent=2))
 
         try:
-            response = await self.llm_model.ainvoke([system_prompt, human_prompt])
+            response = await llm_invoke(self.llm_model, [system_prompt, human_prompt], "answer_generation")
             print(f"📥 LLM response received ({len(response.content)} characters)")
             
             # Enhanced JSON extraction with better error handling
@@ -0,0 +1,170 @@
+import re
+
+try:
+    from lxml import html as lxml_html
+except ImportError:  # parser reports zero confidence and callers use the LLM
+    lxml_html = None
+
+# LinkedIn Easy Apply form components, recognised by their element id prefix
+KNOWN_COMPONENTS = {
+    'single-line-text-form-component': 'input',
+    'single-typeahead-entity-form-component': 'input',
+    'multiline-text-form-component': 'textarea',
+    'text-entity-list-form-component': 'select',
+    'radio-button-form-component': 'radio',
+    'checkbox-form-component': 'checkbox',
+    'jobs-document-upload': 'file'
+}
+
+# Controls that are part of the modal chrome rather than questions
+SKIP_ID_MARKERS = ['follow-company', 'country-code']
+
+SKIP_INPUT_TYPES = ['hidden', 'submit', 'button', 'reset', 'image']
+
+PLACEHOLDER_OPTIONS = ['select an option', 'choose', 'select']
+
+
+def _clean(text):
+    return re.sub(r"\s+", " ", text or "").strip()
+
+
+def _visible_text(element):
+    """Text of an element, preferring LinkedIn's aria-hidden copy over the visually-hidden duplicate"""
+    if element is None:
+        return ""
+    shown = element.xpath(".//*[@aria-hidden='true']")
+    if shown:
+        return _clean(shown[0].text_content())
+    return _clean(element.text_content())
+
+
+def _component_type(element_id):
+    for prefix, element_type in KNOWN_COMPONENTS.items():
+        if element_id.startswith(prefix):
+            return element_type
+    return None
+
+
+def _should_skip(element_id, question):
+    lowered = element_id.lower()
+    if any(marker in lowered for marker in SKIP_ID_MARKERS):
+        return True
+    if 'country' in lowered and 'code' in lowered:
+        return True
+    return 'country code' in question.lower()
+
+
+def parse_easy_apply_form(form_html):
+    """
+    Parse Easy Apply modal HTML into the question schema used by FormFillAgent
+    (question, element_id, element_type, selector, options).
+
+    Returns:
+        dict with 'questions', 'confidence' (share of controls recognised with
+        question text, 0.0-1.0) and 'unknown_components' (ids not recognised)
+    """
+    result = {'questions': [], 'confidence': 0.0, 'unknown_components': []}
+    if lxml_html is None or not form_html or not form_html.strip():
+        return result
+
+    root = lxml_html.fromstring(form_html)
+
+    labels = {}
+    for label in root.iter('label'):
+        target = label.get('for')
+        if target:
+            labels[target] = label
+
+    questions = []
+    unknown = []
+    seen_groups = set()
+    total = 0
+    recognised = 0
+
+    for element in root.iter('input', 'select', 'textarea'):
+        tag = element.tag
+        input_type = (element.get('type') or 'text').lower() if tag == 'input' else tag
+        if tag == 'input' and input_type in SKIP_INPUT_TYPES:
+            continue
+
+        element_id = element.get('id') or ''
+
+        if input_type in ['radio', 'checkbox']:
+            fieldset = next(element.iterancestors('fieldset'), None)
+            group_key = (fieldset.get('id') if fieldset is not None else None) or element.get('name') or element_id
+            if group_key in seen_groups:
+                continue
+            seen_groups.add(group_key)
+            total += 1
+
+            members = fieldset.xpath(f".//input[@type='{input_type}']") if fieldset is not None else [element]
+            question = _visible_text(fieldset.find('legend')) if fieldset is not None and fieldset.find('legend') is not None else ""
+            group_id = fieldset.get('id') if fieldset is not None and fieldset.get('id') else element_id
+            component = _component_type(group_id) or _component_type(element_id)
+
+            options = []
+            for member in members:
+                label = labels.get(member.get('id') or '')
+                option = (label.get('data-test-text-selectable-option__label') if label is not None else None) \
+                    or member.get('data-test-text-selectable-option__input') \
+                    or _visible_text(label) \
+                    or member.get('value')
+                if option:
+                    options.append(_clean(option))
+
+            # A lone checkbox (e.g. "I agree") is addressed by its own input id
+            if input_type == 'checkbox' and len(members) == 1 and members[0].get('id'):
+                group_id = members[0].get('id')
+                question = question or _visible_text(labels.get(group_id))
+
+            if _should_skip(group_id, question):
+                recognised += 1
+                continue
+            if not component or not question:
+                unknown.append(group_id or group_key)
+                continue
+
+            recognised += 1
+            selector = f"#{group_id}" if group_id else f"input[name='{element.get('name')}']"
+            questions.append({
+                'question': question,
+                'element_id': group_id,
+                'element_type': input_type,
+                'selector': selector,
+                'options': options
+            })
+            continue
+
+        total += 1
+        component = _component_type(element_id)
+        question = _visible_text(labels.get(element_id)) or _clean(element.get('aria-label')) or _clean(element.get('placeholder'))
+
+        if _should_skip(element_id, question):
+            recognised += 1
+            continue
+        if not component or not element_id or not question:
+            unknown.append(element_id or tag)
+            continue
+
+        recognised += 1
+        options = None
+        element_type = 'file' if input_type == 'file' else ('input' if tag == 'input' else tag)
+        if tag == 'select':
+            options = []
+            for option in element.iter('option'):
+                text = _clean(option.text_content()) or _clean(option.get('value'))
+                if text and text.lower() not in PLACEHOLDER_OPTIONS:
+                    options.append(text)
+
+        questions.append({
+            'question': question,
+            'element_id': element_id,
+            'element_type': element_type,
+            'selector': f"#{element_id}",
+            'options': options
+        })
+
+    result['questions'] = questions
+    result['unknown_components'] = unknown
+    result['confidence'] = recognised / total if total else 1.0
+    return result
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from config import FORM_TEMPLATE_CACHE_PATH, FORM_TEMPLATE_CACHE_SIZE
+from run_metrics import run_metrics
+
+# Job- and page-specific parts of LinkedIn element ids: long numeric URN
+# segments (job/question ids) and ember view ids
+_VOLATILE_ID_PARTS = re.compile(r"ember\d+|\d{3,}")
+_NUM_TOKEN = "{n}"
+
+
+def normalize_id(value):
+    """Replace job-specific numeric URN parts of an id/selector with a placeholder"""
+    if not value:
+        return value
+    return _VOLATILE_ID_PARTS.sub(_NUM_TOKEN, str(value))
+
+
+def _normalize_text(text):
+    return re.sub(r"\s+", " ", text or "").strip().lower()
+
+
+def _form_structure(form_html):
+    """
+    Describe the form's controls as (normalized id, kind, label, options) rows,
+    plus a map from normalized id back to the id used on this page.
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(form_html, "html.parser")
+    labels = {}
+    for label in soup.find_all("label"):
+        target = label.get("for")
+        if target:
+            labels[target] = _normalize_text(label.get_text(" ", strip=True))
+
+    rows = []
+    id_map = {}
+    for element in soup.find_all(["input", "select", "textarea", "fieldset"]):
+        kind = element.name
+        if kind == "input":
+            kind = (element.get("type") or "text").lower()
+            if kind in ["hidden", "submit", "button", "reset"]:
+                continue
+
+        element_id = element.get("id", "")
+        norm_id = normalize_id(element_id)
+        if element_id:
+            # Ids that collapse to the same normalized form cannot be remapped
+            id_map[norm_id] = None if norm_id in id_map else element_id
+
+        if kind == "fieldset":
+            legend = element.find("legend")
+            label_text = _normalize_text(legend.get_text(" ", strip=True)) if legend else ""
+        else:
+            label_text = labels.get(element_id, _normalize_text(element.get("placeholder")))
+
+        options = []
+        if kind == "select":
+            options = [_normalize_text(o.get_text(" ", strip=True)) for o in element.find_all("option")]
+
+        rows.append([norm_id, kind, label_text, options])
+
+    return rows, id_map
+
+
+class FormTemplateCache:
+    """
+    Persistent LRU cache of parsed Easy Apply questions, keyed by a structural
+    fingerprint of the modal so recurring form templates skip the LLM.
+    """
+
+    def __init__(self, path=FORM_TEMPLATE_CACHE_PATH, max_entries=FORM_TEMPLATE_CACHE_SIZE):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            for fingerprint, entry in data.get("entries", []):
+                self.entries[fingerprint] = entry
+            print(f"🗂️ Loaded {len(self.entries)} cached form templates")
+        except Exception as e:
+            print(f"⚠️ Failed to load form template cache: {e}")
+
+    def _save(self):
+        if not self.path:
+            return
+        try:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"entries": list(self.entries.items())}, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"⚠️ Failed to save form template cache: {e}")
+
+    def fingerprint(self, form_html):
+        """Return (fingerprint, id_map) for the modal HTML"""
+        rows, id_map = _form_structure(form_html)
+        digest = hashlib.sha1(json.dumps(rows, sort_keys=True).encode("utf-8")).hexdigest()
+        return digest, id_map
+
+    def lookup(self, form_html):
+        """
+        Return the cached question list for this form template with element ids
+        remapped to the current page, or None on a miss.
+        """
+        try:
+            fingerprint, id_map = self.fingerprint(form_html)
+        except Exception as e:
+            print(f"⚠️ Form fingerprinting failed: {e}")
+            return None
+
+        entry = self.entries.get(fingerprint)
+        questions = self._remap(entry["questions"], id_map) if entry else None
+        if questions is None:
+            self.misses += 1
+            run_metrics.incr("form_template_cache_misses")
+            return None
+
+        self.entries.move_to_end(fingerprint)
+        entry["hits"] = entry.get("hits", 0) + 1
+        self.hits += 1
+        run_metrics.incr("form_template_cache_hits")
+        print(f"🗂️ Form template cache hit ({self.hits} hits / {self.misses} misses)")
+        return questions
+
+    def store(self, form_html, questions):
+        """Remember the parsed questions for this form's template"""
+        try:
+            fingerprint, _ = self.fingerprint(form_html)
+        except Exception as e:
+            print(f"⚠️ Form fingerprinting failed: {e}")
+            return
+
+        normalized = []
+        for q in questions:
+            q = dict(q)
+            q["element_id"] = normalize_id(q.get("element_id"))
+            q["selector"] = normalize_id(q.get("selector"))
+            normalized.append(q)
+
+        self.entries[fingerprint] = {"questions": normalized, "created_at": time.time(), "hits": 0}
+        self.entries.move_to_end(fingerprint)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self._save()
+
+    def _remap(self, questions, id_map):
+        remapped = []
+        for q in questions:
+            q = dict(q)
+            norm_id = q.get("element_id")
+            if norm_id and _NUM_TOKEN in norm_id:
+                actual_id = id_map.get(norm_id)
+                if not actual_id:
+                    return None
+                q["element_id"] = actual_id
+                selector = q.get("selector") or ""
+                q["selector"] = selector.replace(norm_id, actual_id) if norm_id in selector else f"#{actual_id}"
+            if _NUM_TOKEN in (q.get("selector") or ""):
+                return None
+            remapped.append(q)
+        return remapped
+
+    def stats(self):
+        return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
+
+
+_cache = None
+
+
+def get_form_template_cache():
+    """Shared cache instance, loaded from disk on first use"""
+    global _cache
+    if _cache is None:
+        _cache = FormTemplateCache()
+    return _cache
@@ -1,38 +1,33 @@
 import asyncio
 import json
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
-from tools import create_tools
-from config import GEMINI_API_KEY, RESUME_PATH
+from config import RESUME_PATH, JOB_LINK_LLM_FALLBACK, APPLICATION_RUNNER
 import re
 from form_fill_agent import FormFillAgent
 from form_fill_sub_agent import FormFillSubAgent
 from Form_Value_Filler_Agent import FormValueFillerAgent
 from collect_user_data import load_user_profile, collect_user_profile
+from readiness import wait_for_selectors, polite_pause, JOB_DETAIL_READY_SELECTORS
+from run_metrics import run_metrics
+from worker_pool import ApplicationWorkerPool
+from pipeline import ApplicationPipeline
+from tool_registry import get_bound_model, get_tool, invoke_tool
+from job_harvester import harvest_job_links_from_elements, extract_job_id
+from job_ledger import get_job_ledger, SUCCESS_STATUSES
+from job_discovery import discover_job_links
+from llm_pool import get_chat_model
+from llm_resilience import llm_invoke, llm_available
+from tracing import get_tracer
 import os
 
-# Two separate LLM instances using Gemini
-gemini_model_1 = ChatGoogleGenerativeAI(
-    model="gemini-2.5-flash-preview-04-17", 
-    google_api_key=GEMINI_API_KEY,
-    temperature=0.1
-) if GEMINI_API_KEY else None
-
-gemini_model_2 = ChatGoogleGenerativeAI(
-    model="gemini-2.5-flash-preview-04-17", 
-    google_api_key=GEMINI_API_KEY,
-    temperature=0.1
-) if GEMINI_API_KEY else None
-
 async def filter_job_links_with_llm(elements_info):
-    if not gemini_model_1:
+    model = get_chat_model()
+    if not model or not llm_available():
         print("No Gemini model available for filtering links.")
         return []
 
     links = elements_info.get("links", [])
 
-    model = gemini_model_1
-
     system_msg = SystemMessage(content="""
         You are a smart filtering assistant.
 
@@ -60,8 +55,9 @@ async def filter_job_links_with_llm(elements_info):
         Do NOT wrap the output in triple backticks.
     """)
 
+    raw_output = None
     try:
-        response = await model.ainvoke([system_msg, human_msg])
+        response = await llm_invoke(model, [system_msg, human_msg], "link_filter")
         raw_output = response.content.strip()
 
         # Remove markdown code block if present (Gemini often adds these)
@@ -73,8 +69,9 @@ async def filter_job_links_with_llm(elements_info):
         return filtered if isinstance(filtered, list) else []
 
     except Exception as e:
-        print(f"❌ Failed to parse filtered links: {e}")
-        print(f"🔎 Raw output was: {repr(response.content)}")
+        print(f"❌ Failed to filter links with the LLM: {e}")
+        if raw_output is not None:
+            print(f"🔎 Raw output was: {repr(raw_output)}")
         return []
 
 def filter_job_links_locally(raw_links: list[str]) -> list[str]:
@@ -105,28 +102,10 @@ def format_history(history):
     )
 
 async def apply_jobs_with_integrated_gemini(navigator, elements_info, job_list_url):
-    if not gemini_model_1 or not gemini_model_2:
+    if not get_chat_model():
         print("Gemini models not available.")
         return "no_model"
 
-    tools = create_tools(navigator, RESUME_PATH)
-    model_click = gemini_model_1.bind_tools(tools)
-
-    print("Filtering Job links ....")
-    job_links = await filter_job_links_with_llm(elements_info)
-    if not job_links:
-        print("⚠️ No job links found after filtering.")
-        return "no_jobs_found"
-
-    print("Total Job Links Found Before Filtering locally : ", len(job_links))
-    job_links = filter_job_links_locally(job_links)
-    print("Total Job Links Found After Filtering locally : ", len(job_links))
-
-    # Import the form filling LLM
-    form_agent = FormFillAgent(navigator, gemini_model_2)
-
-
-
     USER_PROFILE_PATH = "/home/neel/Desktop/HyperLink/Automatic_Job_Selection/Linked_IN/Agents/user_profile.json"
     if not os.path.exists(USER_PROFILE_PATH):
         print("👤 No user profile found. Let's create one...")
@@ -140,90 +119,244 @@ async def apply_jobs_with_integrated_gemini(navigator, elements_info, job_list_u
 
     print(f"👤 User profile keys: {list(user_profile.keys())}")
 
+    async def job_link_stream():
+        found = 0
+        async for job_link in discover_job_links(navigator.page):
+            found += 1
+            yield job_link
+
+        if not found:
+            # The page we were handed may not be a paginated search (or LinkedIn changed markup)
+            job_links = harvest_job_links_from_elements(elements_info)
+            if not job_links and JOB_LINK_LLM_FALLBACK:
+                print("Filtering Job links with LLM ....")
+                job_links = filter_job_links_locally(await filter_job_links_with_llm(elements_info))
+                print("Total Job Links Found After LLM Filtering : ", len(job_links))
+            for job_link in job_links:
+                yield job_link
+
+    if APPLICATION_RUNNER == "workers":
+        async def handle_job(worker, job_link):
+            return await apply_to_single_job(worker.navigator, job_link, user_profile)
+
+        pool = ApplicationWorkerPool(navigator, handle_job)
+        reports = await pool.run(job_link_stream())
+        processed = sum(report['jobs'] for report in reports)
+    else:
+        pipeline = ApplicationPipeline(
+            navigator,
+            stages=PIPELINE_STAGES,
+            new_job=lambda job_link: new_job(job_link, user_profile),
+            start_job=start_job_record,
+            finish_job=finish_job_record
+        )
+        processed = len(await pipeline.run(job_link_stream()))
+
+    if not processed:
+        print("⚠️ No job links found after filtering.")
+        return "no_jobs_found"
 
-    for job_idx, job_link in enumerate(job_links):
-        print(f"\n➡️ Processing job #{job_idx + 1}: {job_link}")
-
-        # --- LLM 1: Navigate to job detail page ---
-        system_message_click = SystemMessage(content=f"""
-            ROLE: Navigation Agent for Job Details
-
-            OBJECTIVE:
-            Navigate to a LinkedIn job detail page using the provided URL.
-
-            STRATEGY:
-            - Navigate to provided Job Link or URL.     
-            - Do NOT attempt to click anything except navigation.
-            - Do not apply to the job — only open the job detail page.
-
-            CONSTRAINTS:
-            - Use one tool call per response.
-            - Do NOT reply with explanations or summaries.
-
-            TARGET JOB LINK:
-            {job_link}
-        """)
-
-        human_message_click = HumanMessage(content="Navigate to the job detail page.")
-
-        try:
-            response_click = await model_click.ainvoke([system_message_click, human_message_click])
-            if response_click.tool_calls:
-                tool_call = response_click.tool_calls[0]
-                tool_name = tool_call['name']
-                tool_args = tool_call['args']
-
-                tool = next((t for t in tools if t.name == tool_name), None)
-                if tool:
-                    try:
-                        await tool.ainvoke(tool_args)
-                        print(f"✅ Navigated to job: {job_link}")
-                    except Exception as e:
-                        print(f"❌ Failed to navigate to job: {e}")
-                        continue
-            else:
-                print("❌ No tool call made for navigation.")
-                continue
-        except Exception as e:
-            print(f"❌ Error in model_click invocation: {e}")
-            continue
+    print(f"\n🏁 Finished processing {processed} jobs")
+    return "processing_complete"
 
-        await asyncio.sleep(3)  # Wait for page to load
-
-        
-        result = await form_agent.apply_to_job()
-        
-        if result == "questions_extracted":
-            questions = form_agent.last_extracted_questions
-            
-            # Initialize and run the simplified form filler
-            form_filler = FormFillSubAgent(navigator, gemini_model_2, RESUME_PATH, user_profile)
-            answers, analysis_result = await form_filler.answer_and_fill(questions)
-
-            form_value_filler = FormValueFillerAgent(navigator, gemini_model_2, RESUME_PATH)
-            
-            if analysis_result:
-                print("\n✅ Form analysis completed successfully")
-                
-                print("\n🤖 Starting automated form filling and submission...")
-                
-                completion_success = await form_value_filler.complete_form_process(answers)
-                
-                if completion_success:
-                    print(f"🎉 Successfully completed application for job #{job_idx + 1}")
-                else:
-                    print(f"❌ Failed to complete application for job #{job_idx + 1}")
-
-            else:
-                print("\n❌ Form analysis failed")
-            
-            
-        else:
-            print("✅ Application completed or no further form questions.")
-            break
 
-        # Wait before processing next job
-        await asyncio.sleep(5)
+def new_job(job_link, user_profile, navigator=None):
+    """State for one job application as it moves through the application steps"""
+    return {
+        'link': job_link,
+        'job_id': extract_job_id(job_link) or job_link,
+        'user_profile': user_profile,
+        'navigator': navigator,
+        'step': 'started',
+        'reason': None,
+        'questions': None,
+        'answers': None
+    }
 
-    print(f"\n🏁 Finished processing {len(job_links)} jobs")
-    return "processing_complete"
\ No newline at end of file
+
+def start_job_record(job):
+    get_job_ledger().mark_started(job['job_id'], job['link'])
+
+
+def finish_job_record(job, status):
+    failure_reason = None if status in SUCCESS_STATUSES else (job['reason'] or status)
+    get_job_ledger().record(job['job_id'], status, step=job['step'], failure_reason=failure_reason)
+
+
+async def apply_to_single_job(navigator, job_link, user_profile):
+    """
+    Open one job, click Easy Apply, answer and submit the form, recording the
+    attempt and its outcome in the job ledger.
+
+    Returns:
+        'applied', 'not_applied', 'needs_manual', 'analysis_failed', 'no_questions',
+        'easy_apply_failed', 'extraction_failed' or 'navigation_failed'
+    """
+    job = new_job(job_link, user_profile, navigator)
+    start_job_record(job)
+    tracer = get_tracer()
+
+    try:
+        with tracer.span("job", job_id=job['job_id']) as job_span:
+            for name, step in PIPELINE_STAGES:
+                with tracer.span(f"stage.{name}") as span:
+                    status = await step(job)
+                    span.set(result=status)
+                if status:
+                    break
+            job_span.set(result=status, step=job['step'])
+    except Exception as e:
+        job['reason'] = str(e)
+        finish_job_record(job, "error")
+        raise
+
+    finish_job_record(job, status)
+    return status
+
+
+async def open_job_page(job):
+    """Step 1: navigate to the job detail page. Returns 'navigation_failed' or None."""
+    run_metrics.incr("jobs_processed")
+    job['step'] = "navigation"
+    navigator = job['navigator']
+    job_link = job['link']
+    if not llm_available():
+        # The job URL is already known, so navigating needs no model
+        result = await invoke_tool(navigator, "navigate_to_url", {"url": job_link})
+        if not str(result).lower().startswith("success"):
+            print(f"❌ Failed to navigate to job: {result}")
+            job['reason'] = str(result)
+            return "navigation_failed"
+        print(f"✅ Navigated to job: {job_link}")
+        await wait_for_selectors(navigator.page, JOB_DETAIL_READY_SELECTORS)
+        await polite_pause(3)
+        return None
+
+    model_click = get_bound_model(get_chat_model())
+
+    # --- LLM 1: Navigate to job detail page ---
+    system_message_click = SystemMessage(content=f"""
+        ROLE: Navigation Agent for Job Details
+
+        OBJECTIVE:
+        Navigate to a LinkedIn job detail page using the provided URL.
+
+        STRATEGY:
+        - Navigate to provided Job Link or URL.     
+        - Do NOT attempt to click anything except navigation.
+        - Do not apply to the job — only open the job detail page.
+
+        CONSTRAINTS:
+        - Use one tool call per response.
+        - Do NOT reply with explanations or summaries.
+
+        TARGET JOB LINK:
+        {job_link}
+    """)
+
+    human_message_click = HumanMessage(content="Navigate to the job detail page.")
+
+    try:
+        response_click = await llm_invoke(model_click, [system_message_click, human_message_click], "job_navigation")
+        if response_click.tool_calls:
+            tool_call = response_click.tool_calls[0]
+            tool_name = tool_call['name']
+            tool_args = tool_call['args']
+
+            if get_tool(tool_name):
+                try:
+                    await invoke_tool(navigator, tool_name, tool_args)
+                    print(f"✅ Navigated to job: {job_link}")
+                except Exception as e:
+                    print(f"❌ Failed to navigate to job: {e}")
+                    job['reason'] = str(e)
+                    return "navigation_failed"
+        else:
+            print("❌ No tool call made for navigation.")
+            return "navigation_failed"
+    except Exception as e:
+        print(f"❌ Error in model_click invocation: {e}")
+        job['reason'] = str(e)
+        return "navigation_failed"
+
+    # Wait for the job detail card to render
+    await wait_for_selectors(navigator.page, JOB_DETAIL_READY_SELECTORS)
+    await polite_pause(3)
+    return None
+
+
+async def extract_job_questions(job):
+    """
+    Step 2: click Easy Apply and extract the form questions.
+    Returns 'easy_apply_failed', 'extraction_failed', 'no_questions' or None.
+    """
+    job['step'] = "easy_apply"
+    form_agent = FormFillAgent(job['navigator'], get_chat_model())
+    result = await form_agent.apply_to_job()
+
+    if result in EASY_APPLY_FAILURES:
+        print(f"❌ Could not open the Easy Apply form: {result}")
+        job['reason'] = result
+        return "easy_apply_failed"
+    if result == "extraction_failed":
+        job['reason'] = result
+        return "extraction_failed"
+    if result != "questions_extracted":
+        print("✅ Application completed or no further form questions.")
+        return "no_questions"
+
+    job['questions'] = form_agent.last_extracted_questions
+    return None
+
+
+async def generate_job_answers(job):
+    """Step 3: answer the questions from memory, resume and profile. Returns 'analysis_failed' or None."""
+    job['step'] = "answers"
+
+    # Initialize and run the simplified form filler
+    form_filler = FormFillSubAgent(job['navigator'], get_chat_model(), RESUME_PATH, job['user_profile'])
+    analysis = await form_filler.answer_and_fill(job['questions'])
+    if not analysis or not analysis[1]:
+        print("\n❌ Form analysis failed")
+        return "analysis_failed"
+    job['answers'] = analysis[0]
+
+    print("\n✅ Form analysis completed successfully")
+    return None
+
+
+async def submit_job_application(job):
+    """Step 4: fill the form and submit it. Returns 'applied', 'needs_manual' or 'not_applied'."""
+    print("\n🤖 Starting automated form filling and submission...")
+    job['step'] = "submission"
+    form_value_filler = FormValueFillerAgent(job['navigator'], get_chat_model(), RESUME_PATH)
+    completion_success = await form_value_filler.complete_form_process(job['answers'])
+
+    # Wait before the page is used for the next job
+    await polite_pause(5)
+
+    if completion_success:
+        run_metrics.incr("jobs_applied")
+        print(f"🎉 Successfully completed application: {job['link']}")
+        return "applied"
+
+    if form_value_filler.needs_manual:
+        # Skipped fields most likely blocked the form; record them for a manual pass
+        run_metrics.incr("jobs_needs_manual")
+        job['reason'] = "needs manual input: " + "; ".join(str(q) for q in form_value_filler.needs_manual)[:500]
+        print(f"👤 Application needs manual input: {job['link']}")
+        return "needs_manual"
+
+    run_metrics.incr("jobs_failed")
+    print(f"❌ Failed to complete application: {job['link']}")
+    return "not_applied"
+
+
+# FormFillAgent.apply_to_job results meaning the modal never opened (retried on a later run)
+EASY_APPLY_FAILURES = ["click_error", "no_tool_call", "tool_not_found", "modal_not_open"]
+
+# Each step returns a final status to stop, or None to continue with the next
+APPLICATION_STEPS = [open_job_page, extract_job_questions, generate_job_answers, submit_job_application]
+
+# The same steps as pipeline stages (names key PIPELINE_STAGE_CONCURRENCY and the stage.* trace spans)
+PIPELINE_STAGES = list(zip(["load", "extract", "answer", "submit"], APPLICATION_STEPS))
@@ -0,0 +1,83 @@
+import time
+from config import TARGET_URL, JOB_TITLE, JOB_LOCATION, DISCOVERY_MAX_JOBS, DISCOVERY_MAX_PAGES, DISCOVERY_PAGE_SIZE, format_linkedin_job_url
+from job_harvester import harvest_job_ids, canonical_job_url
+from readiness import wait_for_selectors
+from job_ledger import get_job_ledger
+from run_metrics import run_metrics
+
+# A results page is ready once job cards (or links to them) are in the DOM
+RESULTS_READY_SELECTORS = ['[data-occludable-job-id]', '[data-job-id]', 'a[href*="/jobs/view/"]']
+
+
+def _on_first_results_page(page):
+    return "/jobs/search" in page.url and "start=" not in page.url
+
+
+async def discover_job_links(page, job_title=JOB_TITLE, location=JOB_LOCATION,
+                             max_jobs=DISCOVERY_MAX_JOBS, max_pages=DISCOVERY_MAX_PAGES):
+    """
+    Walk the job search result pages (start=0, 25, 50, ...) on `page` and yield
+    canonical job URLs as they are found, so applications can start while later
+    pages are still being fetched.
+
+    The first page is harvested in place if `page` is already on it. Jobs the
+    ledger marks as done are skipped. Stops after max_jobs links, max_pages
+    pages, or a page with no job ids not seen before.
+    """
+    seen = set()
+    yielded = 0
+    fetch_s = 0.0
+
+    try:
+        for page_number in range(max_pages):
+            page_started = time.perf_counter()
+            if page_number == 0 and _on_first_results_page(page):
+                print("🔎 Discovering jobs on the current results page")
+            else:
+                url = format_linkedin_job_url(TARGET_URL, job_title, location, start=page_number * DISCOVERY_PAGE_SIZE)
+                print(f"🔎 Discovering jobs on results page {page_number + 1}: {url}")
+                try:
+                    await page.goto(url, wait_until='domcontentloaded', timeout=60000)
+                except Exception as e:
+                    print(f"⚠️ Failed to open results page {page_number + 1}: {e}")
+                    break
+
+            await wait_for_selectors(page, RESULTS_READY_SELECTORS)
+            try:
+                job_ids = await harvest_job_ids(page)
+            except Exception as e:
+                print(f"⚠️ Job discovery failed on page {page_number + 1}: {e}")
+                break
+
+            new_ids = [job_id for job_id in job_ids if job_id not in seen]
+            seen.update(new_ids)
+
+            # Skip jobs the ledger says are already handled, before any navigation
+            pending_ids = get_job_ledger().filter_new(new_ids)
+            skipped = len(new_ids) - len(pending_ids)
+            if skipped:
+                run_metrics.incr("jobs_skipped_ledger", skipped)
+
+            page_ms = (time.perf_counter() - page_started) * 1000
+            fetch_s += page_ms / 1000
+            run_metrics.incr("discovery_pages")
+            run_metrics.observe("discovery_page", page_ms)
+            print(f"🔎 Page {page_number + 1}: {len(job_ids)} jobs, {len(new_ids)} new, "
+                  f"{skipped} already in ledger ({page_ms:.0f}ms)")
+
+            if not new_ids:
+                print("🔎 No new jobs on this page, stopping discovery")
+                break
+
+            for job_id in pending_ids:
+                yield canonical_job_url(job_id)
+                yielded += 1
+                run_metrics.incr("jobs_discovered")
+                if yielded >= max_jobs:
+                    print(f"🔎 Reached max_jobs ({max_jobs}), stopping discovery")
+                    return
+    finally:
+        if fetch_s > 0:
+            rate = round(yielded * 60 / fetch_s, 1)
+            run_metrics.set("discovery_jobs_per_min", rate)
+            print(f"🔎 Discovered {yielded} jobs in {fetch_s:.1f}s of page fetching ({rate} jobs/min)")
@@ -0,0 +1,77 @@
+import re
+from config import TARGET_URL
+
+# Ways a LinkedIn job id shows up on a search results page
+JOB_ID_PATTERNS = [
+    re.compile(r"/jobs/view/(?:[^/?#]*-)?(\d{6,})"),
+    re.compile(r"[?&]currentJobId=(\d{6,})"),
+    re.compile(r"urn:li:[A-Za-z_]*?job(?:Posting)?(?:Card)?:\(?(\d{6,})"),
+    re.compile(r"^(\d{6,})$")
+]
+
+# Raw job references on the results page, in document order, from one evaluate call
+HARVEST_JS = """
+() => {
+    const values = [];
+    document.querySelectorAll('a[href*="/jobs/view/"], a[href*="currentJobId="]').forEach(a => {
+        values.push(a.getAttribute('href'));
+    });
+    document.querySelectorAll('[data-job-id], [data-occludable-job-id], [data-entity-urn*="job"], [data-urn*="job"]').forEach(el => {
+        for (const attr of ['data-job-id', 'data-occludable-job-id', 'data-entity-urn', 'data-urn']) {
+            const value = el.getAttribute(attr);
+            if (value) values.push(value);
+        }
+    });
+    return values;
+}
+"""
+
+
+def extract_job_id(value):
+    """Return the numeric LinkedIn job id referenced by an href, attribute or URN, if any"""
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    for pattern in JOB_ID_PATTERNS:
+        match = pattern.search(value)
+        if match:
+            return match.group(1)
+    return None
+
+
+def canonical_job_url(job_id):
+    return f"{TARGET_URL}/jobs/view/{job_id}/"
+
+
+def job_ids_from_values(values):
+    """Extract job ids from raw values, deduplicated in first-seen order"""
+    seen = set()
+    job_ids = []
+    for value in values:
+        job_id = extract_job_id(value)
+        if job_id and job_id not in seen:
+            seen.add(job_id)
+            job_ids.append(job_id)
+    return job_ids
+
+
+def harvest_job_links_from_elements(elements_info):
+    """Canonical job URLs from the links of an existing page snapshot"""
+    hrefs = [link.get('href') for link in elements_info.get('links', [])]
+    return [canonical_job_url(job_id) for job_id in job_ids_from_values(hrefs)]
+
+
+async def harvest_job_ids(page):
+    """Job ids on the current results page, from hrefs, job-card data attributes and URNs"""
+    values = await page.evaluate(HARVEST_JS)
+    return job_ids_from_values(values)
+
+
+async def harvest_job_links(page):
+    """Canonical job detail URLs on the current results page, without any LLM call"""
+    try:
+        job_ids = await harvest_job_ids(page)
+    except Exception as e:
+        print(f"⚠️ Job link harvesting failed: {e}")
+        return []
+    return [canonical_job_url(job_id) for job_id in job_ids]
@@ -0,0 +1,122 @@
+import sqlite3
+import time
+from config import JOB_LEDGER_PATH, LEDGER_SKIP_STATUSES, LEDGER_MAX_ATTEMPTS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    job_url TEXT,
+    status TEXT NOT NULL,
+    step TEXT,
+    failure_reason TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    first_seen_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
+"""
+
+# Statuses that mean the job finished successfully; anything else is recorded as a failure reason
+SUCCESS_STATUSES = ['applied']
+
+# SQLite's default limit on bound parameters is 999 in older builds
+_LOOKUP_BATCH = 500
+
+
+class JobLedger:
+    """
+    On-disk record of every job the agent has touched, keyed by LinkedIn job id:
+    status, step reached, failure reason, attempt count and timestamps.
+    """
+
+    def __init__(self, path=JOB_LEDGER_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def get(self, job_id):
+        row = self.conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def _is_done(self, row):
+        return row['status'] in LEDGER_SKIP_STATUSES or row['attempts'] >= LEDGER_MAX_ATTEMPTS
+
+    def filter_new(self, job_ids):
+        """
+        Return the job ids that still need processing, in order. A job is skipped
+        if its status is in LEDGER_SKIP_STATUSES or it has used up its attempts.
+        """
+        job_ids = list(job_ids)
+        done = set()
+        for i in range(0, len(job_ids), _LOOKUP_BATCH):
+            batch = job_ids[i:i + _LOOKUP_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = self.conn.execute(
+                f"SELECT job_id, status, attempts FROM jobs WHERE job_id IN ({placeholders})", batch
+            ).fetchall()
+            done.update(row['job_id'] for row in rows if self._is_done(row))
+        return [job_id for job_id in job_ids if job_id not in done]
+
+    def should_skip(self, job_id):
+        row = self.get(job_id)
+        return bool(row) and self._is_done(row)
+
+    def mark_started(self, job_id, job_url=None):
+        """Record the start of an attempt on a job"""
+        now = time.time()
+        self.conn.execute(
+            """
+            INSERT INTO jobs (job_id, job_url, status, step, attempts, first_seen_at, updated_at)
+            VALUES (?, ?, 'in_progress', 'started', 1, ?, ?)
+            ON CONFLICT(job_id) DO UPDATE SET
+                job_url = COALESCE(excluded.job_url, job_url),
+                status = 'in_progress',
+                step = 'started',
+                failure_reason = NULL,
+                attempts = attempts + 1,
+                updated_at = excluded.updated_at
+            """,
+            (job_id, job_url, now, now)
+        )
+        self.conn.commit()
+
+    def record(self, job_id, status, step=None, failure_reason=None, job_url=None):
+        """Record the outcome of an attempt"""
+        now = time.time()
+        self.conn.execute(
+            """
+            INSERT INTO jobs (job_id, job_url, status, step, failure_reason, attempts, first_seen_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, 0, ?, ?)
+            ON CONFLICT(job_id) DO UPDATE SET
+                job_url = COALESCE(excluded.job_url, job_url),
+                status = excluded.status,
+                step = COALESCE(excluded.step, step),
+                failure_reason = excluded.failure_reason,
+                updated_at = excluded.updated_at
+            """,
+            (job_id, job_url, status, step, failure_reason, now, now)
+        )
+        self.conn.commit()
+
+    def counts(self):
+        """Number of jobs per status"""
+        rows = self.conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        return {row['status']: row['n'] for row in rows}
+
+    def close(self):
+        self.conn.close()
+
+
+_ledger = None
+
+
+def get_job_ledger():
+    """Shared ledger, opened on first use"""
+    global _ledger
+    if _ledger is None:
+        _ledger = JobLedger()
+    return _ledger
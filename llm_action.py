@@ -1,15 +1,10 @@
-import json
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import HumanMessage, SystemMessage
-from config import GEMINI_API_KEY, JOB_LOCATION, JOB_TITLE, TARGET_JOB_URL, RESUME_PATH
-from tools import create_tools
+from config import JOB_LOCATION, JOB_TITLE, TARGET_JOB_URL, RESUME_PATH
+from tool_registry import get_bound_model, get_tool, invoke_tool
 from job_agent import apply_jobs_with_integrated_gemini
-
-model = ChatGoogleGenerativeAI(
-    model="gemini-2.5-flash-preview-04-17",
-    google_api_key=GEMINI_API_KEY,
-    temperature=0.1
-) if GEMINI_API_KEY else None
+from llm_pool import get_chat_model
+from llm_resilience import llm_invoke, llm_available
+from prompt_compactor import compact_page_elements
 
 
 async def ask_llm_for_action_with_tools(navigator_instance, elements_info, goal, current_step):
@@ -17,7 +12,7 @@ async def ask_llm_for_action_with_tools(navigator_instance, elements_info, goal,
     if navigator_instance.is_verification_page(elements_info):
         return "human_verification"
 
-    if not model:
+    if not get_chat_model() or not llm_available():
         print("No LLM available, using fallback logic...")
         return await navigator_instance.execute_fallback_action(elements_info, current_step)
 
@@ -76,8 +71,7 @@ async def ask_generic_agent(navigator, elements_info, goal, step):
     )
 
 async def _invoke_llm_tool_use(navigator, elements_info, goal, step, agent_role, extra_instruction=""):
-    tools = create_tools(navigator, RESUME_PATH)
-    model_with_tools = model.bind_tools(tools)
+    model_with_tools = get_bound_model(get_chat_model())
 
     # Construct action history
     history = ""
@@ -87,6 +81,8 @@ async def _invoke_llm_tool_use(navigator, elements_info, goal, step, agent_role,
             for a in navigator.action_history[-5:]
         ]) + "\nDo not repeat successful actions.\n"
 
+    page_elements, _ = compact_page_elements(elements_info, step)
+
     # System prompt
     system_message = SystemMessage(content=f"""
     You are {agent_role}, responsible for the step: {step}
@@ -101,15 +97,8 @@ async def _invoke_llm_tool_use(navigator, elements_info, goal, step, agent_role,
     If a tool call results in an error (e.g., clicking the Search button fails or the button is not found or visible),
     try calling another appropriate tool such as pressing Enter on the input field instead.
 
-    AVAILABLE PAGE ELEMENTS:
-    BUTTONS ({elements_info['total_buttons']}):
-    {json.dumps(elements_info['buttons'], indent=2)}
-    
-    LINKS ({elements_info['total_links']}):
-    {json.dumps(elements_info['links'], indent=2)}
-    
-    INPUTS ({elements_info['total_inputs']} total):
-    {json.dumps(elements_info['inputs'], indent=2)}
+    AVAILABLE PAGE ELEMENTS (visible elements, most relevant to this step; one row per element, columns separated by |):
+    {page_elements}
 
     RULES:
     - Use ONE tool call per response
@@ -118,22 +107,21 @@ async def _invoke_llm_tool_use(navigator, elements_info, goal, step, agent_role,
 
     human_message = HumanMessage(content=f"What action should I take next? Step: {step}")
 
-    response = model_with_tools.invoke([system_message, human_message])
+    response = await llm_invoke(model_with_tools, [system_message, human_message], "page_action")
 
     if response.tool_calls:
         tool_name = response.tool_calls[0]['name']
         tool_args = response.tool_calls[0]['args']
         print(f"🤖 Tool selected: {tool_name}, Args: {tool_args}")
-        for tool in tools:
-            if tool.name == tool_name:
-                try:
-                    result = await tool.ainvoke(tool_args) if hasattr(tool, 'ainvoke') else tool.invoke(tool_args)
-                    print(f"🔧 Tool result: {result}")
-
-                    return "tool_executed"
-                except Exception as tool_err:
-                    print(f"⚠️ Tool failed: {tool_err}")
-                    return "tool_failed"
+        if get_tool(tool_name):
+            try:
+                result = await invoke_tool(navigator, tool_name, tool_args)
+                print(f"🔧 Tool result: {result}")
+
+                return "tool_executed"
+            except Exception as tool_err:
+                print(f"⚠️ Tool failed: {tool_err}")
+                return "tool_failed"
 
     print(f"🤖 No tool used. Response: {response.content}")
     return "no_tool_used"
@@ -0,0 +1,129 @@
+import asyncio
+import time
+from config import LLM_MAX_CONCURRENCY, LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE, LLM_EXPECTED_OUTPUT_TOKENS
+from prompt_compactor import estimate_tokens
+from run_metrics import run_metrics
+from tracing import get_tracer
+
+
+class TokenBucket:
+    """Refills `per_minute` units evenly over a minute, holding at most a minute's worth"""
+
+    def __init__(self, per_minute):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def take(self, amount):
+        """Wait until `amount` units are available and take them"""
+        # A request bigger than the whole bucket waits for a full bucket instead of forever
+        amount = min(float(amount), self.capacity)
+        while True:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+            await asyncio.sleep((amount - self.tokens) / self.rate)
+
+    def adjust(self, amount):
+        """Charge (or refund, if negative) the difference between estimated and actual usage"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+def _message_tokens(messages):
+    return sum(estimate_tokens(str(getattr(message, 'content', message))) for message in messages)
+
+
+def _usage_tokens(response):
+    usage = getattr(response, 'usage_metadata', None) or {}
+    return usage.get('total_tokens')
+
+
+class LLMGateway:
+    """
+    Single entry point for model calls. Caps concurrent calls and keeps requests
+    and tokens per minute under the configured limits. Callers are admitted in
+    arrival order, so a busy worker cannot starve the others.
+    """
+
+    def __init__(self, max_concurrency=LLM_MAX_CONCURRENCY,
+                 requests_per_minute=LLM_REQUESTS_PER_MINUTE, tokens_per_minute=LLM_TOKENS_PER_MINUTE):
+        self.slots = asyncio.Semaphore(max(1, max_concurrency))
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        # asyncio.Lock wakes waiters in FIFO order, which is what makes admission fair
+        self.admission = asyncio.Lock()
+
+    def busy(self):
+        """Whether another caller is currently waiting for admission (a slot or rate budget)"""
+        return self.admission.locked()
+
+    async def ainvoke(self, model, messages, call_type="generic", timeout=None, admitted=None):
+        """
+        Invoke `model` (a chat model or one with tools bound) through the gateway.
+
+        Args:
+            model: object with an async ainvoke(messages) method
+            messages: list of LangChain messages
+            call_type: label used for metrics (e.g. 'answer_generation')
+            timeout: optional deadline in seconds for the model call itself,
+                     not counting time spent waiting for capacity
+            admitted: optional asyncio.Event, set once the call has been admitted
+        """
+        estimated = _message_tokens(messages) + LLM_EXPECTED_OUTPUT_TOKENS
+        queued = time.perf_counter()
+
+        with get_tracer().span(f"llm.{call_type}", tokens_estimated=estimated) as span:
+            async with self.admission:
+                await self.slots.acquire()
+                try:
+                    await self.requests.take(1)
+                    await self.tokens.take(estimated)
+                except BaseException:
+                    self.slots.release()
+                    raise
+
+            if admitted is not None:
+                admitted.set()
+            wait_ms = (time.perf_counter() - queued) * 1000
+            run_metrics.observe("llm_gateway_wait", wait_ms)
+            span.set(wait_ms=round(wait_ms, 1))
+            if wait_ms > 1000:
+                print(f"🚦 LLM call '{call_type}' waited {wait_ms / 1000:.1f}s for capacity")
+
+            started = time.perf_counter()
+            try:
+                if timeout:
+                    response = await asyncio.wait_for(model.ainvoke(messages), timeout=timeout)
+                else:
+                    response = await model.ainvoke(messages)
+            finally:
+                self.slots.release()
+                run_metrics.observe(f"llm_{call_type}", (time.perf_counter() - started) * 1000)
+                run_metrics.incr("llm_calls")
+
+            actual = _usage_tokens(response)
+            if actual:
+                self.tokens.adjust(actual - estimated)
+            run_metrics.incr("llm_tokens", actual or estimated)
+            span.set(tokens=actual, tool_calls=len(getattr(response, 'tool_calls', None) or []))
+            return response
+
+
+_gateway = None
+
+
+def get_llm_gateway():
+    """Shared gateway, so every agent and worker draws from the same limits"""
+    global _gateway
+    if _gateway is None:
+        _gateway = LLMGateway()
+    return _gateway
+
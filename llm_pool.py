@@ -0,0 +1,31 @@
+from config import GEMINI_API_KEY, GEMINI_MODEL, LLM_TEMPERATURE
+
+# One client per (model, temperature), created on first use and shared by every
+# agent so they reuse the same HTTP connections
+_clients = {}
+
+
+def get_chat_model(model_name=None, temperature=None):
+    """
+    Return the shared Gemini chat client, creating it on first call.
+
+    Returns:
+        ChatGoogleGenerativeAI instance, or None when no API key is configured
+    """
+    if not GEMINI_API_KEY:
+        return None
+
+    key = (model_name or GEMINI_MODEL, LLM_TEMPERATURE if temperature is None else temperature)
+    client = _clients.get(key)
+    if client is None:
+        # Imported here so modules that never call the LLM don't pay for langchain
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        client = ChatGoogleGenerativeAI(
+            model=key[0],
+            google_api_key=GEMINI_API_KEY,
+            temperature=key[1]
+        )
+        _clients[key] = client
+        print(f"🧠 LLM client created: {key[0]}")
+    return client
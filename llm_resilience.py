@@ -0,0 +1,201 @@
+import asyncio
+import random
+import time
+from config import (
+    LLM_DEADLINES, LLM_DEFAULT_DEADLINE_S, LLM_MAX_RETRIES, LLM_RETRY_BASE_S, LLM_RETRY_MAX_S,
+    LLM_HEDGE_CALL_TYPES, LLM_HEDGE_AFTER_S, LLM_BREAKER_FAILURES, LLM_BREAKER_COOLDOWN_S
+)
+from llm_gateway import get_llm_gateway
+from run_metrics import run_metrics
+
+# Provider errors worth retrying: rate limits, overload and server-side failures.
+# Matched by exception class name or message so no provider SDK import is needed.
+RETRYABLE_ERROR_NAMES = ['ResourceExhausted', 'TooManyRequests', 'ServiceUnavailable', 'InternalServerError',
+                         'DeadlineExceeded', 'GatewayTimeout', 'TimeoutError', 'ConnectionError', 'RemoteProtocolError']
+RETRYABLE_ERROR_MARKERS = ['429', '500', '502', '503', '504', 'rate limit', 'quota', 'overloaded',
+                           'unavailable', 'resource exhausted', 'timed out', 'timeout', 'connection reset']
+
+
+class LLMUnavailableError(Exception):
+    """Raised instead of calling the model while the circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failed calls. While open, calls
+    are refused for `cooldown_s`; then one trial call is let through, and its
+    success closes the breaker again.
+    """
+
+    def __init__(self, failure_threshold=LLM_BREAKER_FAILURES, cooldown_s=LLM_BREAKER_COOLDOWN_S):
+        self.failure_threshold = failure_threshold
+        self.cooldown_s = cooldown_s
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown_s:
+            return "half_open"
+        return "open"
+
+    def allow(self):
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self.trial_in_flight:
+            self.trial_in_flight = True
+            return True
+        return False
+
+    def available(self):
+        """Whether a call would currently be let through (without claiming the half-open trial)"""
+        state = self.state
+        return state == "closed" or (state == "half_open" and not self.trial_in_flight)
+
+    def record_success(self):
+        if self.opened_at is not None:
+            print("🟢 LLM circuit breaker closed, provider is responding again")
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+
+    def release_trial(self):
+        """Give back the half-open trial slot of a call that ended without a result (e.g. cancelled)"""
+        self.trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self.trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            run_metrics.incr("llm_breaker_opened")
+            print(f"🔴 LLM circuit breaker open for {self.cooldown_s}s after {self.failures} failures, "
+                  f"using deterministic paths")
+
+
+_breaker = None
+
+
+def get_circuit_breaker():
+    global _breaker
+    if _breaker is None:
+        _breaker = CircuitBreaker()
+    return _breaker
+
+
+def llm_available():
+    """False while the circuit breaker is open; callers should take their deterministic path"""
+    return get_circuit_breaker().available()
+
+
+def is_retryable(error):
+    if isinstance(error, asyncio.TimeoutError):
+        return True
+    name = type(error).__name__
+    message = str(error).lower()
+    return any(n in name for n in RETRYABLE_ERROR_NAMES) or any(m in message for m in RETRYABLE_ERROR_MARKERS)
+
+
+def backoff_delay(attempt):
+    """Exponential backoff with full jitter: uniform(0, min(max, base * 2^attempt))"""
+    return random.uniform(0, min(LLM_RETRY_MAX_S, LLM_RETRY_BASE_S * (2 ** attempt)))
+
+
+async def _hedged_invoke(model, messages, call_type, deadline):
+    """
+    Start a second identical call if the first has not returned LLM_HEDGE_AFTER_S
+    after being admitted by the gateway, and return whichever succeeds first.
+    Time queued for capacity does not count, and no hedge is sent while other
+    callers are queued, since it would only add load to a saturated gateway.
+    """
+    gateway = get_llm_gateway()
+    admitted = asyncio.Event()
+    first = asyncio.ensure_future(gateway.ainvoke(model, messages, call_type, deadline, admitted=admitted))
+    try:
+        admission = asyncio.ensure_future(admitted.wait())
+        try:
+            await asyncio.wait({first, admission}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            admission.cancel()
+        done, _ = await asyncio.wait({first}, timeout=LLM_HEDGE_AFTER_S)
+        if done:
+            return first.result()
+        if gateway.busy():
+            return await first
+    except BaseException:
+        first.cancel()
+        raise
+
+    run_metrics.incr("llm_hedged_calls")
+    second = asyncio.ensure_future(gateway.ainvoke(model, messages, call_type, deadline))
+    pending = {first, second}
+    error = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is second:
+                        run_metrics.incr("llm_hedge_wins")
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def llm_invoke(model, messages, call_type="generic"):
+    """
+    Call the model through the shared gateway with a per-call-type deadline
+    (for the model call itself, not the wait for gateway capacity),
+    bounded retries with jittered exponential backoff, hedging for the
+    idempotent call types in LLM_HEDGE_CALL_TYPES, and the circuit breaker.
+
+    Raises:
+        LLMUnavailableError if the breaker is open; otherwise the last error
+        once retries are exhausted or the error is not retryable.
+    """
+    breaker = get_circuit_breaker()
+    deadline = LLM_DEADLINES.get(call_type, LLM_DEFAULT_DEADLINE_S)
+
+    for attempt in range(LLM_MAX_RETRIES + 1):
+        if not breaker.allow():
+            run_metrics.incr("llm_calls_refused")
+            raise LLMUnavailableError(f"LLM circuit breaker is open, skipping '{call_type}' call")
+
+        try:
+            if call_type in LLM_HEDGE_CALL_TYPES:
+                response = await _hedged_invoke(model, messages, call_type, deadline)
+            else:
+                response = await get_llm_gateway().ainvoke(model, messages, call_type, deadline)
+            breaker.record_success()
+            return response
+
+        except Exception as e:
+            if is_retryable(e):
+                breaker.record_failure()
+            else:
+                # The provider answered; the request itself was rejected
+                breaker.record_success()
+            if isinstance(e, asyncio.TimeoutError):
+                run_metrics.incr("llm_timeouts")
+                e = asyncio.TimeoutError(f"'{call_type}' call exceeded its {deadline}s deadline")
+            if attempt == LLM_MAX_RETRIES or not is_retryable(e) or not breaker.available():
+                run_metrics.incr("llm_failures")
+                raise e
+            delay = backoff_delay(attempt)
+            run_metrics.incr("llm_retries")
+            print(f"🔁 LLM '{call_type}' call failed ({type(e).__name__}: {e}), retry {attempt + 1}/{LLM_MAX_RETRIES} in {delay:.1f}s")
+
+        except BaseException:
+            # Cancelled (or interrupted): neither a success nor a failure, but a
+            # half-open trial must give its slot back or the breaker never closes
+            breaker.release_trial()
+            raise
+
+        await asyncio.sleep(delay)
@@ -1,12 +1,74 @@
+import ast
 import asyncio
+import glob
+import importlib
+import os
+import sys
+import time
 from config import GEMINI_API_KEY, LINKEDIN_EMAIL, LINKEDIN_PASSWORD
-from navigator import LinkedInJobsNavigator
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def project_modules():
+    """
+    Top-level project modules, each listed after the project modules it imports,
+    so --import-report charges every module only its own import time.
+    """
+    paths = {os.path.splitext(os.path.basename(p))[0]: p for p in glob.glob(os.path.join(PROJECT_DIR, "*.py"))}
+    paths.pop("main", None)
+
+    imports = {}
+    for name, path in paths.items():
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+        found = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                found.update(alias.name.split(".")[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                found.add(node.module.split(".")[0])
+        imports[name] = sorted(found & paths.keys() - {name})
+
+    ordered = []
+    def visit(name, seen):
+        if name in ordered or name in seen:
+            return
+        for dependency in imports[name]:
+            visit(dependency, seen | {name})
+        ordered.append(name)
+
+    for name in sorted(paths):
+        visit(name, frozenset())
+    return ordered
+
+def report_import_times():
+    """Import each project module and print the time spent (including any dependencies it pulls in first)"""
+    print("=== IMPORT TIME REPORT ===")
+    total = 0.0
+    for name in project_modules():
+        start = time.perf_counter()
+        try:
+            importlib.import_module(name)
+            status = ""
+        except ImportError as e:
+            status = f"  ❌ {e}"
+        elapsed = (time.perf_counter() - start) * 1000
+        total += elapsed
+        print(f"{name:<26}{elapsed:>9.1f} ms{status}")
+    print(f"{'total':<26}{total:>9.1f} ms")
+    print("==========================\n")
 
 async def main():
+    # Deferred so the configuration check runs without loading the browser/LLM stack
+    from navigator import LinkedInJobsNavigator
+
     navigator = LinkedInJobsNavigator()
     await navigator.navigate_to_jobs()
 
 if __name__ == "__main__":
+    if "--import-report" in sys.argv:
+        report_import_times()
+        exit(0)
     print("=== CONFIGURATION CHECK ===")
     print(f"Gemini API Key set: {'Yes' if GEMINI_API_KEY else 'No'}")
     print(f"LinkedIn Email set: {'Yes' if LINKEDIN_EMAIL else 'No'}")
@@ -0,0 +1,36 @@
+import asyncio
+from config import (
+    MANUAL_INPUT_PROMPTS, MAX_CONCURRENT_APPLICATIONS, APPLICATION_RUNNER, PIPELINE_PAGES, BROWSER_PROFILES
+)
+
+# One console prompt at a time; created lazily so it binds to the running loop
+_prompt_lock = None
+
+
+def jobs_in_flight():
+    """Most applications the configured runner has open at once"""
+    return PIPELINE_PAGES if APPLICATION_RUNNER == "pipeline" else MAX_CONCURRENT_APPLICATIONS
+
+
+def manual_input_allowed(browser_profile, during_applications=True):
+    """
+    Whether the agent may stop for a console prompt. Needs a visible browser, and
+    while applying, a single job in flight (PIPELINE_PAGES=1 for the pipeline
+    runner, MAX_CONCURRENT_APPLICATIONS=1 for the workers runner).
+    """
+    if not MANUAL_INPUT_PROMPTS or BROWSER_PROFILES[browser_profile]["headless"]:
+        return False
+    if during_applications:
+        return jobs_in_flight() == 1
+    return True
+
+
+async def ask_human(prompt, page_url=None):
+    """Wait for ENTER in a thread so the event loop keeps running, naming the page that needs attention"""
+    global _prompt_lock
+    if _prompt_lock is None:
+        _prompt_lock = asyncio.Lock()
+    async with _prompt_lock:
+        if page_url:
+            print(f"\n👤 Manual input needed on: {page_url}")
+        return await asyncio.to_thread(input, prompt)
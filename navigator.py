@@ -1,21 +1,20 @@
 import asyncio
 import json
-from playwright.async_api import async_playwright
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.tools import tool
-from langchain_core.messages import HumanMessage, SystemMessage
+import os
+import time
 from typing import Dict, Any, List, Optional
-from config import TARGET_URL, GEMINI_API_KEY, LINKEDIN_EMAIL, LINKEDIN_PASSWORD, TARGET_JOB_URL
-from llm_action import ask_llm_for_action_with_tools
-
-model = ChatGoogleGenerativeAI(
-    model="gemini-2.5-flash-preview-04-17",
-    google_api_key=GEMINI_API_KEY,
-    temperature=0.1
-) if GEMINI_API_KEY else None
+from config import TARGET_URL, LINKEDIN_EMAIL, LINKEDIN_PASSWORD, TARGET_JOB_URL, EASY_APPLY_MODAL_SELECTOR, BROWSER_PROFILE, BROWSER_PROFILES, STORAGE_STATE_PATH
+from dom_snapshot import take_dom_snapshot
+from readiness import wait_until_ready, wait_for_network_quiet, polite_pause
+from run_metrics import run_metrics
+from radio import build_radio_index
+from selector_resolver import get_selector_resolver
+from tracing import get_tracer
+from manual_input import manual_input_allowed, ask_human
 
 class LinkedInJobsNavigator:
-    def __init__(self):
+    def __init__(self, browser_profile=None):
+        self.browser_profile = browser_profile or BROWSER_PROFILE
         self.browser = None
         self.context = None
         self.page = None
@@ -25,14 +24,110 @@ class LinkedInJobsNavigator:
         self.page_elements = {}
         self.action_history = []
         self.max_history = 10
+        self.session_saved = False
+        self.radio_index = None
         
     async def setup_browser(self):
-        """Initialize Playwright browser"""
+        """Initialize Playwright browser using the selected launch profile"""
+        if self.browser_profile not in BROWSER_PROFILES:
+            print(f"⚠️ Unknown browser profile '{self.browser_profile}', using 'interactive'")
+            self.browser_profile = "interactive"
+        profile = BROWSER_PROFILES[self.browser_profile]
+        print(f"🖥️ Browser profile: {self.browser_profile}")
+        run_metrics.set("browser_profile", self.browser_profile)
+
+        # Playwright is imported on first use so config checks start quickly
+        from playwright.async_api import async_playwright
+
         self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=False, slow_mo=1000)
-        self.context = await self.browser.new_context()
-        self.page = await self.context.new_page()   
+        self.browser = await self.playwright.chromium.launch(
+            headless=profile["headless"],
+            slow_mo=profile["slow_mo"],
+            args=profile["args"]
+        )
+        context_options = {}
+        if profile["viewport"]:
+            context_options["viewport"] = profile["viewport"]
+        if os.path.exists(STORAGE_STATE_PATH):
+            print(f"🔑 Loading saved session from {STORAGE_STATE_PATH}")
+            context_options["storage_state"] = STORAGE_STATE_PATH
+        self.context = await self.browser.new_context(**context_options)
+        self.page = await self.context.new_page()
+
+    async def has_session_cookie(self):
+        """Check for an unexpired LinkedIn auth cookie (li_at) in the browser context"""
+        try:
+            cookies = await self.context.cookies(TARGET_URL)
+        except Exception as e:
+            print(f"⚠️ Could not read cookies: {e}")
+            return False
+        now = time.time()
+        return any(
+            c['name'] == 'li_at' and (c.get('expires', -1) == -1 or c['expires'] > now)
+            for c in cookies
+        )
+
+    async def restore_session(self):
+        """
+        Try to resume a saved session by opening TARGET_JOB_URL directly.
+        Returns True if the page loaded while still logged in.
+        """
+        if not await self.has_session_cookie():
+            return False
+
+        print("🔑 Saved session found, validating...")
+        try:
+            await self.page.goto(TARGET_JOB_URL, wait_until='domcontentloaded', timeout=60000)
+            await self.wait_for_page_stable()
+        except Exception as e:
+            print(f"⚠️ Session validation navigation failed: {e}")
+            return False
+
+        current_url = self.page.url
+        logged_out = any(marker in current_url for marker in ['/login', '/authwall', '/checkpoint', '/signup', '/uas/'])
+        if logged_out or not await self.has_session_cookie():
+            print("🔒 Saved session has expired, falling back to login flow.")
+            return False
+
+        print("✅ Saved session is valid, skipping login.")
+        # LinkedIn rotates cookies on use; write them back now that login is confirmed
+        await self.save_session()
+        return True
+
+    async def save_session(self):
+        """Persist the logged-in storage state so the next run can skip login"""
+        try:
+            if not await self.has_session_cookie():
+                return False
+            await self.context.storage_state(path=STORAGE_STATE_PATH)
+            self.session_saved = True
+            print(f"💾 Session saved to {STORAGE_STATE_PATH}")
+            return True
+        except Exception as e:
+            print(f"⚠️ Failed to save session: {e}")
+            return False
         
+    async def spawn_worker(self):
+        """
+        Create a navigator for a concurrent worker. It shares this navigator's
+        browser and logged-in context but drives its own page.
+        """
+        worker = LinkedInJobsNavigator(browser_profile=self.browser_profile)
+        worker.playwright = self.playwright
+        worker.browser = self.browser
+        worker.context = self.context
+        worker.page = await self.context.new_page()
+        worker.current_step = self.current_step
+        return worker
+
+    async def close_worker(self):
+        """Close a worker's page, leaving the shared browser and context open"""
+        try:
+            if self.page and not self.page.is_closed():
+                await self.page.close()
+        except Exception as e:
+            print(f"⚠️ Failed to close worker page: {e}")
+
     async def check_page_state(self):
         """Check if page is still valid and accessible"""
         try:
@@ -44,15 +139,11 @@ class LinkedInJobsNavigator:
             print(f"Page state check failed: {e}")
             return False
     
-    async def wait_for_page_stable(self, timeout=10):
+    async def wait_for_page_stable(self, timeout=10, selectors=None):
         """Wait for page to be stable and ready for interaction"""
-        try:
-            await self.page.wait_for_load_state('domcontentloaded', timeout=timeout*1000)
-            await asyncio.sleep(2)
-            return True
-        except Exception as e:
-            print(f"Page stability wait failed: {e}")
-            return False
+        ready = await wait_until_ready(self.page, selectors=selectors, timeout=timeout*1000)
+        await polite_pause(2)
+        return ready
 
     async def extract_easy_apply_modal_html(self) -> str:
         """
@@ -63,7 +154,7 @@ class LinkedInJobsNavigator:
                 raise Exception("No page object available")
 
             # This class is unique to the Easy Apply modal content
-            modal = self.page.locator("div.jobs-easy-apply-modal__content").first
+            modal = self.page.locator(EASY_APPLY_MODAL_SELECTOR).first
             await modal.wait_for(state="visible", timeout=5000)
 
             html = await modal.evaluate("el => el.outerHTML")
@@ -74,117 +165,66 @@ class LinkedInJobsNavigator:
             return ""
 
     
-    async def get_page_elements(self):
-        """Extract structured data of buttons, links, and inputs from the current page."""
+    async def refresh_radio_index(self):
+        """Rebuild the radio input index for the current form step"""
+        self.radio_index = await build_radio_index(self.page)
+        print(f"📻 Indexed {len(self.radio_index)} radio inputs")
+        return self.radio_index
+
+    async def is_easy_apply_modal_open(self) -> bool:
+        """Check whether the Easy Apply dialog is currently visible"""
+        try:
+            return await self.page.locator(EASY_APPLY_MODAL_SELECTOR).first.is_visible()
+        except Exception as e:
+            # Reported rather than swallowed: a broken selector would otherwise look like a closed modal
+            print(f"⚠️ Easy Apply modal check failed: {e}")
+            return False
+
+    async def get_form_step_elements(self):
+        """
+        Extract page elements for a form step, scoped to the Easy Apply modal when it is open.
+        Falls back to the whole page otherwise.
+        """
+        if await self.is_easy_apply_modal_open():
+            return await self.get_page_elements(root=EASY_APPLY_MODAL_SELECTOR)
+        return await self.get_page_elements()
+
+    async def get_page_elements(self, root=None):
+        """
+        Extract structured data of buttons, links, and inputs from the current page.
+
+        Args:
+            root: Optional CSS selector or Locator to limit extraction to one subtree
+        """
         try:
             if not await self.check_page_state():
                 print("Page is not accessible, waiting for stability...")
                 if not await self.wait_for_page_stable():
                     raise Exception("Page became inaccessible")
 
-            await asyncio.sleep(2)  # wait for DOM to settle
+            await self.page.wait_for_load_state('domcontentloaded', timeout=10000)
 
             current_url = self.page.url
-            page_title = await self.page.title()
-
-            button_data, link_data, input_data = [], [], []
+            snapshot = await take_dom_snapshot(self.page, root=root)
 
-            # -----------------------
-            # Collect all <a> links
-            # -----------------------
-            try:
-                links = await self.page.query_selector_all('a')
-                seen_hrefs = set()
-
-                for i, link in enumerate(links):
-                    try:
-                        text = await link.text_content() or ""
-                        href = await link.get_attribute('href') or ""
-                        href = href.strip()
-                        if not href or href.startswith("javascript:") or href in seen_hrefs:
-                            continue
-
-                        seen_hrefs.add(href)
-                        is_visible = await link.is_visible()
-                        target = await link.get_attribute('target')
-                        rel = await link.get_attribute('rel')
-
-                        link_data.append({
-                            'index': i + 1,
-                            'text': text.strip(),
-                            'href': href,
-                            'visible': is_visible,
-                            'target': target,
-                            'rel': rel
-                        })
-                    except Exception as e:
-                        print(f"Error processing link {i}: {e}")
-                        continue
-            except Exception as e:
-                print(f"Error getting links: {e}")
+            button_data = snapshot['buttons']
+            link_data = snapshot['links']
+            input_data = snapshot['inputs']
+            stats = snapshot['snapshot_stats']
 
-            # -----------------------
-            # Collect all <button>
-            # -----------------------
-            try:
-                buttons = await self.page.query_selector_all('button')
-                for i, button in enumerate(buttons):
-                    try:
-                        text = await button.text_content()
-                        onclick = await button.get_attribute('onclick')
-                        css_class = await button.get_attribute('class')
-                        is_visible = await button.is_visible()
-
-                        if text and text.strip():
-                            button_data.append({
-                                'index': i + 1,
-                                'text': text.strip(),
-                                'onclick': onclick,
-                                'class': css_class,
-                                'visible': is_visible
-                            })
-                    except Exception as e:
-                        print(f"Error processing button {i}: {e}")
-            except Exception as e:
-                print(f"Error getting buttons: {e}")
-
-            # -----------------------
-            # Collect all <input>
-            # -----------------------
-            try:
-                inputs = await self.page.query_selector_all('input')
-                for i, input_elem in enumerate(inputs):
-                    try:
-                        input_type = await input_elem.get_attribute('type')
-                        placeholder = await input_elem.get_attribute('placeholder')
-                        name = await input_elem.get_attribute('name')
-                        id_attr = await input_elem.get_attribute('id')
-                        is_visible = await input_elem.is_visible()
-                        is_enabled = await input_elem.is_enabled()
-
-                        input_data.append({
-                            'index': i + 1,
-                            'type': input_type,
-                            'placeholder': placeholder,
-                            'name': name,
-                            'id': id_attr,
-                            'visible': is_visible,
-                            'enabled': is_enabled
-                        })
-                    except Exception as e:
-                        print(f"Error processing input {i}: {e}")
-            except Exception as e:
-                print(f"Error getting inputs: {e}")
+            scope = f" within {root}" if isinstance(root, str) else (" within locator" if root is not None else "")
+            print(f"📸 Snapshot{scope} took {stats['duration_ms']}ms ({stats['nodes_visited']} nodes visited)")
 
             elements_info = {
                 'current_url': current_url,
-                'page_title': page_title,
+                'page_title': snapshot['page_title'],
                 'buttons': button_data,
                 'links': link_data,
                 'inputs': input_data,
                 'total_buttons': len(button_data),
                 'total_links': len(link_data),
-                'total_inputs': len(input_data)
+                'total_inputs': len(input_data),
+                'snapshot_stats': stats
             }
 
             self.page_elements = elements_info
@@ -233,12 +273,19 @@ class LinkedInJobsNavigator:
         return any(verification_indicators)
 
     async def wait_for_human_verification(self, elements_info):
-        """Handle human verification step"""
+        """
+        Handle human verification step. Returns False when nobody can solve it
+        (headless browser or prompts disabled).
+        """
         print("\n" + "="*80)
         print("SECURITY VERIFICATION DETECTED")
         print("="*80)
         
-        input("\nPress ENTER after completing verification manually...")
+        if not manual_input_allowed(self.browser_profile, during_applications=False):
+            print(f"❌ Verification needs a person, but the '{self.browser_profile}' profile cannot prompt for it")
+            return False
+
+        await ask_human("\nPress ENTER after completing verification manually...", elements_info.get('current_url'))
         
         print("\nContinuing automation...")
         self.human_intervention_needed = False
@@ -263,12 +310,16 @@ class LinkedInJobsNavigator:
     
     async def navigate_to_jobs(self):
         """Main navigation flow with tool calling"""
+        # The agent/LLM stack is only needed once the browser run starts
+        from llm_action import ask_llm_for_action_with_tools
+
         await self.setup_browser()
         
         try:
-            print(f"Starting navigation to {TARGET_URL}")
-            await self.page.goto(TARGET_URL, wait_until='domcontentloaded', timeout=60000)
-            await self.wait_for_page_stable()
+            if not await self.restore_session():
+                print(f"Starting navigation to {TARGET_URL}")
+                await self.page.goto(TARGET_URL, wait_until='domcontentloaded', timeout=60000)
+                await self.wait_for_page_stable()
             
             max_steps = 25
             step_count = 0
@@ -287,7 +338,8 @@ class LinkedInJobsNavigator:
                     if 'error' in elements_info:
                         print(f"Page extraction error: {elements_info['error']}")
                         consecutive_errors += 1
-                        await asyncio.sleep(5)
+                        await wait_for_network_quiet(self.page)
+                        await polite_pause(5)
                         continue
                     
                     print(f"Current URL: {elements_info['current_url']}")
@@ -310,9 +362,13 @@ class LinkedInJobsNavigator:
                     else:
                         print(f"🌐 Unknown page context for URL: {current_url}")
 
+                    if self.current_step in ["homepage", "Applying_Jobs"] and not self.session_saved:
+                        await self.save_session()
+
                     # Handle verification page
                     if self.is_verification_page(elements_info):
-                        await self.wait_for_human_verification(elements_info)
+                        if not await self.wait_for_human_verification(elements_info):
+                            break
                         continue
                     
                     goal = (
@@ -329,15 +385,18 @@ class LinkedInJobsNavigator:
 
                     # Use LLM with tools
                     print("\n🤖 Asking LLM to determine next action...")
-                    action_result = await ask_llm_for_action_with_tools(
-                        self,
-                        elements_info, 
-                        goal, 
-                        self.current_step
-                    )
+                    with get_tracer().span("navigator.step", step=step_count, page_step=self.current_step) as span:
+                        action_result = await ask_llm_for_action_with_tools(
+                            self,
+                            elements_info, 
+                            goal, 
+                            self.current_step
+                        )
+                        span.set(result=action_result)
                     
                     if action_result == "human_verification":
-                        await self.wait_for_human_verification(elements_info)
+                        if not await self.wait_for_human_verification(elements_info):
+                            break
                     if action_result == "processing_complete":
                         break
                     elif action_result in ["tool_executed", "fallback_executed"]:
@@ -345,12 +404,14 @@ class LinkedInJobsNavigator:
                     else:
                         consecutive_errors += 1
                     
-                    await asyncio.sleep(3)
+                    await wait_until_ready(self.page)
+                    await polite_pause(3)
                     
                 except Exception as e:
                     print(f"Error in step {step_count}: {e}")
                     consecutive_errors += 1
-                    await asyncio.sleep(5)
+                    await wait_for_network_quiet(self.page)
+                    await polite_pause(5)
                     continue
             
             if consecutive_errors >= 3:
@@ -360,14 +421,23 @@ class LinkedInJobsNavigator:
             else:
                 print(f"\n🎉 Navigation completed after {step_count} steps!")
             
-            print("Browser will remain open for some seconds for inspection...")
-            await asyncio.sleep(10)
+            if not BROWSER_PROFILES[self.browser_profile]["headless"]:
+                print("Browser will remain open for some seconds for inspection...")
+                await asyncio.sleep(10)
             
         except KeyboardInterrupt:
             print("\nNavigation interrupted by user")
         except Exception as e:
             print(f"Critical error in navigation: {e}")
         finally:
+            run_metrics.print_summary()
+            get_selector_resolver().print_stats()
+            get_tracer().print_summary()
+            run_metrics.dump()
+            get_tracer().flush()
+            if self.session_saved:
+                # Keep cookies rotated during the run, so the saved session does not go stale
+                await self.save_session()
             if self.browser:
                 try:
                     await self.browser.close()
@@ -0,0 +1,200 @@
+import asyncio
+import time
+from config import PIPELINE_PAGES, PIPELINE_QUEUE_SIZE, PIPELINE_STAGE_CONCURRENCY
+from run_metrics import run_metrics
+from tracing import get_tracer
+
+
+class PipelineStage:
+    """One step of the application pipeline with its own workers and a bounded input queue"""
+
+    def __init__(self, name, handler, concurrency, queue_size=PIPELINE_QUEUE_SIZE):
+        self.name = name
+        self.handler = handler
+        self.concurrency = max(1, concurrency)
+        self.queue = asyncio.Queue(maxsize=max(1, queue_size))
+        self.processed = 0
+        self.busy_ms = 0.0
+        self.wait_ms = 0.0
+        self.max_depth = 0
+
+    def report(self):
+        return {
+            'stage': self.name,
+            'concurrency': self.concurrency,
+            'jobs': self.processed,
+            'avg_ms': round(self.busy_ms / self.processed, 1) if self.processed else 0.0,
+            'avg_wait_ms': round(self.wait_ms / self.processed, 1) if self.processed else 0.0,
+            'max_queue_depth': self.max_depth
+        }
+
+
+class ApplicationPipeline:
+    """
+    Runs job applications as a pipeline of stages connected by bounded queues:
+    job links → page load → question extraction → answer generation → fill/submit.
+
+    A job holds a browser page from page load until it leaves the pipeline, and
+    at most `pages` jobs are in flight. While one job waits on the LLM in the
+    answer stage, other pages are loading jobs and filling forms. A full queue
+    blocks the stage before it, so no stage runs far ahead of the next.
+
+    Each stage handler is awaited as handler(job) and returns a final status to
+    take the job out of the pipeline, or None to pass it to the next stage.
+    """
+
+    def __init__(self, navigator, stages, new_job, start_job=None, finish_job=None, pages=PIPELINE_PAGES):
+        """
+        Args:
+            navigator: logged-in navigator whose context the job pages are opened in
+            stages: list of (name, handler) in pipeline order
+            new_job: new_job(job_link) -> job dict; the pipeline sets job['navigator']
+            start_job: optional start_job(job), called once the job has a page
+            finish_job: optional finish_job(job, status), called when the job leaves
+        """
+        self.navigator = navigator
+        self.new_job = new_job
+        self.start_job = start_job
+        self.finish_job = finish_job
+        self.page_count = max(1, pages)
+        self.pages = asyncio.Queue()
+        self.stages = [
+            PipelineStage(name, handler, PIPELINE_STAGE_CONCURRENCY.get(name, 1))
+            for name, handler in stages
+        ]
+        self.results = []
+
+    async def run(self, job_links):
+        """
+        Push every link in job_links (a list or async iterator) through the pipeline.
+
+        Returns:
+            list of {'job_link', 'status', 'step', 'duration_s'}
+        """
+        page_navigators = []
+        for _ in range(self.page_count):
+            page_navigator = await self.navigator.spawn_worker()
+            page_navigators.append(page_navigator)
+            self.pages.put_nowait(page_navigator)
+
+        print(f"🏭 Pipeline with {self.page_count} page(s): " + ", ".join(
+            f"{stage.name}×{stage.concurrency}" for stage in self.stages
+        ))
+
+        try:
+            await asyncio.gather(
+                self._produce(job_links),
+                *(self._run_stage(i) for i in range(len(self.stages)))
+            )
+        finally:
+            for page_navigator in page_navigators:
+                await page_navigator.close_worker()
+
+        self._print_report()
+        return self.results
+
+    async def _produce(self, job_links):
+        """Feed jobs into the first stage, then one stop marker (None) per first-stage worker"""
+        first = self.stages[0]
+        try:
+            if isinstance(job_links, list):
+                for link in job_links:
+                    await self._enqueue(first, self.new_job(link))
+            else:
+                async for link in job_links:
+                    await self._enqueue(first, self.new_job(link))
+        except Exception as e:
+            print(f"❌ Job link producer failed: {e}")
+        finally:
+            for _ in range(first.concurrency):
+                await first.queue.put(None)
+
+    async def _enqueue(self, stage, job):
+        job['enqueued_at'] = time.perf_counter()
+        await stage.queue.put(job)
+        depth = stage.queue.qsize()
+        stage.max_depth = max(stage.max_depth, depth)
+        run_metrics.sample(f"pipeline_{stage.name}_queue_depth", depth)
+
+    async def _run_stage(self, index):
+        stage = self.stages[index]
+        await asyncio.gather(*(self._stage_worker(index) for _ in range(stage.concurrency)))
+
+        # All of this stage's workers are done, so the next stage gets its stop markers
+        if index + 1 < len(self.stages):
+            next_stage = self.stages[index + 1]
+            for _ in range(next_stage.concurrency):
+                await next_stage.queue.put(None)
+
+    async def _stage_worker(self, index):
+        stage = self.stages[index]
+        is_last = index + 1 == len(self.stages)
+
+        while True:
+            job = await stage.queue.get()
+            if job is None:
+                return
+
+            wait_ms = (time.perf_counter() - job['enqueued_at']) * 1000
+            if index == 0:
+                # A free page is the pipeline's main backpressure
+                page_wait_started = time.perf_counter()
+                job['navigator'] = await self.pages.get()
+                job['started_at'] = time.perf_counter()
+                run_metrics.observe("pipeline_page_wait", (job['started_at'] - page_wait_started) * 1000)
+                if self.start_job:
+                    try:
+                        self.start_job(job)
+                    except Exception as e:
+                        print(f"⚠️ Failed to record job start: {e}")
+
+            started = time.perf_counter()
+            try:
+                with get_tracer().span(f"stage.{stage.name}", job_id=job.get('job_id', job['link']), queue_wait_ms=round(wait_ms, 1)) as span:
+                    status = await stage.handler(job)
+                    span.set(result=status)
+            except Exception as e:
+                print(f"❌ [{stage.name}] Unhandled error on {job['link']}: {e}")
+                job['reason'] = str(e)
+                status = "error"
+            busy_ms = (time.perf_counter() - started) * 1000
+
+            stage.processed += 1
+            stage.busy_ms += busy_ms
+            stage.wait_ms += wait_ms
+            run_metrics.observe(f"pipeline_{stage.name}", busy_ms)
+            run_metrics.observe(f"pipeline_{stage.name}_wait", wait_ms)
+
+            if status or is_last:
+                self._finish(job, status or "completed")
+            else:
+                await self._enqueue(self.stages[index + 1], job)
+
+    def _finish(self, job, status):
+        if self.finish_job:
+            try:
+                self.finish_job(job, status)
+            except Exception as e:
+                print(f"⚠️ Failed to record job result: {e}")
+        get_tracer().record("job", job['started_at'], job_id=job.get('job_id', job['link']), result=status, step=job.get('step'))
+        self.results.append({
+            'job_link': job['link'],
+            'status': status,
+            'step': job.get('step'),
+            'duration_s': round(time.perf_counter() - job['started_at'], 1)
+        })
+        print(f"🏭 {status}: {job['link']}")
+        navigator, job['navigator'] = job['navigator'], None
+        self.pages.put_nowait(navigator)
+
+    def _print_report(self):
+        print("\n" + "=" * 60)
+        print("🏭 PIPELINE STAGES")
+        print("=" * 60)
+        for stage in self.stages:
+            report = stage.report()
+            print(f"{report['stage']} (×{report['concurrency']}): {report['jobs']} jobs, avg {report['avg_ms']}ms, "
+                  f"avg queue wait {report['avg_wait_ms']}ms, max queue depth {report['max_queue_depth']}")
+        statuses = [r['status'] for r in self.results]
+        print(f"Jobs: {len(statuses)}, applied: {statuses.count('applied')}")
+        print("=" * 60)
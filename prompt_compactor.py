@@ -0,0 +1,133 @@
+import json
+import re
+from config import PROMPT_TOKEN_BUDGET, PROMPT_TEXT_MAX_CHARS
+from run_metrics import run_metrics
+
+# Words that make an element relevant to a navigation step
+STEP_KEYWORDS = {
+    'login': ['email', 'username', 'session_key', 'password', 'session_password', 'sign in', 'signin', 'login', 'submit'],
+    'homepage': ['jobs', 'search', 'keyword', 'location', 'title', 'skill', 'company'],
+    'Applying_Jobs': ['easy apply', 'apply', 'next', 'review', 'submit', 'continue', '/jobs/view/']
+}
+
+# Elements that are never the right target for the agent
+NOISE_KEYWORDS = ['google', 'apple', 'microsoft', 'cookie', 'privacy', 'terms', 'help center', 'ad choices']
+
+SECTION_COLUMNS = {
+    'buttons': ['index', 'text'],
+    'links': ['index', 'text', 'href'],
+    'inputs': ['index', 'type', 'id', 'name', 'placeholder']
+}
+
+
+def estimate_tokens(text):
+    """Rough token count for Gemini prompts (~4 characters per token)"""
+    return (len(text) + 3) // 4
+
+
+def _keywords_for_step(step):
+    if step.startswith('login') or step.startswith('fill') or step == 'submit_login':
+        return STEP_KEYWORDS['login']
+    return STEP_KEYWORDS.get(step, [])
+
+
+def _cell(value):
+    text = re.sub(r"\s+", " ", "" if value is None else str(value)).strip().replace("|", "/")
+    if len(text) > PROMPT_TEXT_MAX_CHARS:
+        text = text[:PROMPT_TEXT_MAX_CHARS - 1] + "…"
+    return text
+
+
+def _dedupe_key(kind, element):
+    if kind == 'buttons':
+        return _cell(element.get('text')).lower()
+    if kind == 'links':
+        return (_cell(element.get('text')).lower(), element.get('href'))
+    return (element.get('id'), element.get('name'), element.get('type'))
+
+
+def _score(kind, element, keywords):
+    haystack = " ".join(str(element.get(key) or "") for key in SECTION_COLUMNS[kind]).lower()
+    score = sum(3 for keyword in keywords if keyword in haystack)
+    if any(noise in haystack for noise in NOISE_KEYWORDS):
+        score -= 5
+    # Inputs are rare and almost always what a step has to fill
+    if kind == 'inputs':
+        score += 2
+    return score
+
+
+def _candidates(elements_info, keywords):
+    candidates = []
+    for kind in SECTION_COLUMNS:
+        seen = set()
+        for position, element in enumerate(elements_info.get(kind, [])):
+            if element.get('visible') is False or element.get('enabled') is False:
+                continue
+            if kind == 'inputs' and (element.get('type') or '').lower() == 'hidden':
+                continue
+            key = _dedupe_key(kind, element)
+            if key in seen:
+                continue
+            seen.add(key)
+            row = "|".join(_cell(element.get(column)) for column in SECTION_COLUMNS[kind])
+            candidates.append({
+                'kind': kind,
+                'score': _score(kind, element, keywords),
+                'position': position,
+                'row': row,
+                'tokens': estimate_tokens(row) + 1
+            })
+    return candidates
+
+
+def compact_page_elements(elements_info, step, budget=None):
+    """
+    Encode the buttons, links and inputs of a page snapshot as compact tables
+    that fit within a token budget.
+
+    Invisible, disabled and duplicate elements are dropped, and the remaining
+    ones are kept in order of relevance to the current step until the budget
+    is spent. Each table lists its rows in page order.
+
+    Returns:
+        (text, stats) where stats holds tokens_before, tokens_after and
+        elements kept/total
+    """
+    budget = budget or PROMPT_TOKEN_BUDGET
+    keywords = _keywords_for_step(step)
+
+    tokens_before = estimate_tokens(json.dumps(
+        {kind: elements_info.get(kind, []) for kind in SECTION_COLUMNS}, indent=2
+    ))
+    total = sum(len(elements_info.get(kind, [])) for kind in SECTION_COLUMNS)
+
+    candidates = _candidates(elements_info, keywords)
+    ranked = sorted(candidates, key=lambda c: (-c['score'], c['position']))
+
+    spent = 0
+    kept = {kind: [] for kind in SECTION_COLUMNS}
+    for candidate in ranked:
+        if spent + candidate['tokens'] > budget:
+            continue
+        spent += candidate['tokens']
+        kept[candidate['kind']].append(candidate)
+
+    sections = []
+    for kind, columns in SECTION_COLUMNS.items():
+        rows = sorted(kept[kind], key=lambda c: c['position'])
+        sections.append(f"{kind.upper()} ({len(rows)} of {len(elements_info.get(kind, []))}) {'|'.join(columns)}")
+        sections.extend(c['row'] for c in rows)
+    text = "\n".join(sections)
+
+    stats = {
+        'tokens_before': tokens_before,
+        'tokens_after': estimate_tokens(text),
+        'elements_kept': sum(len(rows) for rows in kept.values()),
+        'elements_total': total
+    }
+    run_metrics.incr("prompt_tokens_before", stats['tokens_before'])
+    run_metrics.incr("prompt_tokens_after", stats['tokens_after'])
+    print(f"🗜️ Prompt elements for '{step}': ~{stats['tokens_before']} → ~{stats['tokens_after']} tokens "
+          f"({stats['elements_kept']}/{stats['elements_total']} elements)")
+    return text, stats
@@ -1,4 +1,103 @@
-from bs4 import BeautifulSoup
+import re
+
+# Every radio input on the page with its option value and grouping, in one evaluate call
+RADIO_INDEX_JS = """
+() => Array.from(document.querySelectorAll('input[type="radio"]')).map(input => {
+    const fieldset = input.closest('fieldset');
+    return {
+        id: input.id || '',
+        name: input.getAttribute('name') || '',
+        value: (input.getAttribute('data-test-text-selectable-option__input') || input.getAttribute('value') || '').trim(),
+        fieldset_id: fieldset ? (fieldset.id || '') : ''
+    };
+})
+"""
+
+_OPTION_SUFFIX = re.compile(r"-\d+$")
+
+
+class RadioIndex:
+    """
+    Lookup tables for the radio inputs of one form step. Maps fieldset id,
+    input id, base id (input id without its -N suffix) and name to
+    {option value -> (input id, label selector)}.
+    """
+
+    def __init__(self, radios):
+        self.radios = [r for r in radios if r.get('id')]
+        self.by_input_id = {}
+        self.groups = {}
+        for radio in self.radios:
+            value = radio['value'].strip().lower()
+            target = (radio['id'], f'label[for="{radio["id"]}"]')
+            self.by_input_id[radio['id']] = (value, target)
+            base_id = _OPTION_SUFFIX.sub("", radio['id'])
+            for key in {radio.get('fieldset_id'), radio.get('name'), base_id}:
+                if key:
+                    self.groups.setdefault(key, {}).setdefault(value, target)
+
+    @classmethod
+    def from_html(cls, html):
+        """Build the index from page HTML (offline use; the agent uses from_page)"""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, "html.parser")
+        radios = []
+        for radio in soup.find_all("input", {"type": "radio"}):
+            fieldset = radio.find_parent("fieldset")
+            radios.append({
+                'id': radio.get("id", ""),
+                'name': radio.get("name", ""),
+                'value': (radio.get("data-test-text-selectable-option__input", "") or radio.get("value", "")).strip(),
+                'fieldset_id': fieldset.get("id", "") if fieldset else ""
+            })
+        return cls(radios)
+
+    @classmethod
+    async def from_page(cls, page):
+        return cls(await page.evaluate(RADIO_INDEX_JS))
+
+    def resolve(self, element_id, value):
+        """
+        Resolve a question's element id (input, fieldset, base or name) and the
+        chosen option value to (input id, label selector), or None.
+        A missing or empty value resolves to None rather than to any option.
+        """
+        value = (value or "").strip().lower()
+        if not value:
+            return None
+
+        # 🔹 Input ID is correct and matches value
+        match = self.by_input_id.get(element_id)
+        if match and match[0] == value:
+            return match[1]
+
+        # 🔹 Fieldset ID, base input ID without suffix, or input name
+        group = self.groups.get(element_id) or self.groups.get(_OPTION_SUFFIX.sub("", element_id))
+        if group:
+            if value in group:
+                return group[value]
+            for option_value, target in group.items():
+                if option_value and (value in option_value or option_value in value):
+                    return target
+
+        # 🔹 Partial id/name match (in-memory scan, no page access)
+        for radio in self.radios:
+            option_value = radio['value'].strip().lower()
+            if option_value and (value in option_value or option_value in value):
+                if element_id in radio['id'] or element_id in radio['name']:
+                    return self.by_input_id[radio['id']][1]
+
+        return None
+
+    def __len__(self):
+        return len(self.radios)
+
+
+async def build_radio_index(page):
+    """Index the radio inputs currently on the page"""
+    return await RadioIndex.from_page(page)
+
 
 async def resolve_radio_input_id(self, element_id: str, value: str) -> str:
     """
@@ -6,55 +105,22 @@ async def resolve_radio_input_id(self, element_id: str, value: str) -> str:
     - A fieldset/group ID (from LLM)
     - A base input ID without suffix (e.g., -0, -1)
     - A slightly incorrect input ID
+
+    Uses the navigator's radio index for the current form step, rebuilding it
+    once if the element is not found (the step may have changed).
     """
     try:
-        html = await self.page.content()
-        soup = BeautifulSoup(html, "html.parser")
-        value = value.strip().lower()
-
         print(f"[resolve_radio_input_id] Resolving for: {element_id} → {value}")
 
-        # 🔹 Case 1: Input ID is correct and matches value
-        input_elem = soup.find("input", {"id": element_id, "type": "radio"})
-        if input_elem:
-            input_val = input_elem.get("data-test-text-selectable-option__input", "").strip().lower() or input_elem.get("value", "").strip().lower()
-            if input_val == value:
-                print(f"[resolve_radio_input_id] ✅ Exact input ID match: {element_id}")
-                return element_id
-
-        # 🔹 Case 2: Fieldset ID (e.g. LLM gives radio-button-form-component-... or anything that wraps inputs)
-        fieldset = soup.find("fieldset", {"id": element_id})
-        if fieldset:
-            print(f"[resolve_radio_input_id] 🔍 Treating as fieldset ID")
-            radio_inputs = fieldset.find_all("input", {"type": "radio"})
-            for radio in radio_inputs:
-                input_val = radio.get("data-test-text-selectable-option__input", "").strip().lower() or radio.get("value", "").strip().lower()
-                if input_val == value and radio.has_attr("id"):
-                    print(f"[resolve_radio_input_id] ✅ Found input inside fieldset: {radio['id']}")
-                    return radio["id"]
-
-        # 🔹 Case 3: Base input ID without suffix (-0, -1, etc.)
-        if not element_id.endswith(tuple(f"-{i}" for i in range(6))):
-            for i in range(6):
-                candidate_id = f"{element_id}-{i}"
-                input_elem = soup.find("input", {"id": candidate_id, "type": "radio"})
-                if input_elem:
-                    input_val = input_elem.get("data-test-text-selectable-option__input", "").strip().lower() or input_elem.get("value", "").strip().lower()
-                    if input_val == value:
-                        print(f"[resolve_radio_input_id] ✅ Corrected with suffix: {candidate_id}")
-                        return candidate_id
-
-        # 🔹 Case 4: Try matching by name (from input name attr)
-        input_elems = soup.find_all("input", {"type": "radio"})
-        for input_elem in input_elems:
-            input_id = input_elem.get("id", "")
-            input_name = input_elem.get("name", "")
-            input_val = input_elem.get("data-test-text-selectable-option__input", "").strip().lower() or input_elem.get("value", "").strip().lower()
-
-            if value in input_val or input_val in value:
-                if element_id in input_id or element_id in input_name:
-                    print(f"[resolve_radio_input_id] ✅ Matched by name or partial ID: {input_id}")
-                    return input_id
+        index = self.radio_index if self.radio_index is not None else await self.refresh_radio_index()
+        match = index.resolve(element_id, value)
+        if match is None:
+            index = await self.refresh_radio_index()
+            match = index.resolve(element_id, value)
+
+        if match:
+            print(f"[resolve_radio_input_id] ✅ Resolved: {match[0]}")
+            return match[0]
 
         print(f"[resolve_radio_input_id] ❌ Could not resolve, returning original ID: {element_id}")
         return element_id
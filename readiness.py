@@ -0,0 +1,120 @@
+import asyncio
+from config import POLITE_MODE, READY_TIMEOUT_MS, NETWORK_QUIET_TIMEOUT_MS, EASY_APPLY_MODAL_SELECTOR
+from tracing import get_tracer
+
+# Elements that show a job detail page has rendered enough to act on
+JOB_DETAIL_READY_SELECTORS = [
+    "button.jobs-apply-button",
+    ".jobs-unified-top-card",
+    ".job-details-jobs-unified-top-card__container--two-pane",
+    ".jobs-details__main-content"
+]
+
+# Identifies the current Easy Apply step: header, progress value and the ids of its fields
+MODAL_STEP_SIGNATURE_JS = """
+(selector) => {
+    const modal = document.querySelector(selector);
+    if (!modal) return '';
+    const header = modal.querySelector('h3');
+    const progress = modal.querySelector('progress, [role="progressbar"]');
+    const fieldIds = Array.from(modal.querySelectorAll('input, select, textarea'))
+        .map(el => el.id || el.name || '')
+        .join('|');
+    return [
+        header ? header.textContent.trim() : '',
+        progress ? (progress.getAttribute('value') || progress.getAttribute('aria-valuenow') || '') : '',
+        fieldIds
+    ].join('#');
+}
+"""
+
+
+async def polite_pause(seconds):
+    """Fixed pause between actions, only taken when POLITE_MODE is enabled"""
+    if POLITE_MODE and seconds > 0:
+        with get_tracer().span("sleep.polite_pause", seconds=seconds):
+            await asyncio.sleep(seconds)
+
+
+async def wait_for_selectors(page, selectors, timeout=READY_TIMEOUT_MS, state="visible"):
+    """
+    Wait until any of the given selectors reaches the requested state.
+
+    Returns:
+        True if one of them appeared within the timeout, False otherwise.
+    """
+    if isinstance(selectors, str):
+        selectors = [selectors]
+    try:
+        await page.wait_for_selector(", ".join(selectors), state=state, timeout=timeout)
+        return True
+    except Exception:
+        print(f"⏱️ None of {selectors} became {state} within {timeout}ms")
+        return False
+
+
+async def wait_for_network_quiet(page, timeout=NETWORK_QUIET_TIMEOUT_MS):
+    """
+    Wait for network quiescence. LinkedIn keeps long-polling connections open,
+    so this is bounded tightly and a timeout is not treated as an error.
+    """
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+        return True
+    except Exception:
+        return False
+
+
+async def wait_for_url_change(page, previous_url, timeout=READY_TIMEOUT_MS):
+    """Wait until the page URL differs from previous_url"""
+    try:
+        await page.wait_for_function("(previous) => window.location.href !== previous", arg=previous_url, timeout=timeout)
+        return True
+    except Exception:
+        print(f"⏱️ URL did not change from {previous_url} within {timeout}ms")
+        return False
+
+
+async def modal_step_signature(page, selector=EASY_APPLY_MODAL_SELECTOR):
+    """Return a signature of the current Easy Apply step ('' when the modal is closed)"""
+    try:
+        return await page.evaluate(MODAL_STEP_SIGNATURE_JS, selector)
+    except Exception:
+        return ""
+
+
+async def wait_for_modal_step_change(page, previous_signature, selector=EASY_APPLY_MODAL_SELECTOR, timeout=READY_TIMEOUT_MS):
+    """
+    Wait until the Easy Apply modal shows a different step than previous_signature.
+    A closed modal (application submitted or dismissed) also counts as a change.
+    """
+    try:
+        await page.wait_for_function(
+            f"([selector, previous]) => ({MODAL_STEP_SIGNATURE_JS})(selector) !== previous",
+            arg=[selector, previous_signature],
+            timeout=timeout
+        )
+        return True
+    except Exception:
+        print(f"⏱️ Easy Apply step did not change within {timeout}ms")
+        return False
+
+
+async def wait_until_ready(page, selectors=None, timeout=READY_TIMEOUT_MS, network_quiet=False):
+    """
+    Wait for a page to be usable: DOM loaded and target selectors present (if given).
+    Network quiescence is only awaited when `network_quiet` is set, bounded by
+    NETWORK_QUIET_TIMEOUT_MS.
+    """
+    try:
+        await page.wait_for_load_state("domcontentloaded", timeout=timeout)
+    except Exception as e:
+        print(f"Page stability wait failed: {e}")
+        return False
+
+    ready = True
+    if selectors:
+        ready = await wait_for_selectors(page, selectors, timeout=timeout)
+    if network_quiet:
+        await wait_for_network_quiet(page)
+    return ready
@@ -0,0 +1,90 @@
+import json
+import time
+from collections import defaultdict
+from config import RUN_METRICS_PATH
+
+
+class RunMetrics:
+    """Counters, timings and run settings collected over one run of the agent"""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.info = {}
+        self.counters = defaultdict(int)
+        self.timings = defaultdict(list)
+        self.samples = defaultdict(list)
+
+    def set(self, key, value):
+        """Record a run setting (e.g. browser profile)"""
+        self.info[key] = value
+
+    def incr(self, key, amount=1):
+        self.counters[key] += amount
+
+    def observe(self, key, duration_ms):
+        """Record one duration sample in milliseconds"""
+        self.timings[key].append(duration_ms)
+
+    def sample(self, key, value):
+        """Record one gauge reading (e.g. a queue depth)"""
+        self.samples[key].append(value)
+
+    def summary(self):
+        elapsed = time.time() - self.started_at
+        timings = {
+            key: {
+                "count": len(values),
+                "total_ms": round(sum(values), 1),
+                "avg_ms": round(sum(values) / len(values), 1)
+            }
+            for key, values in self.timings.items() if values
+        }
+        gauges = {
+            key: {
+                "count": len(values),
+                "max": max(values),
+                "avg": round(sum(values) / len(values), 1)
+            }
+            for key, values in self.samples.items() if values
+        }
+        summary = {
+            "started_at": self.started_at,
+            "elapsed_s": round(elapsed, 1),
+            "info": dict(self.info),
+            "counters": dict(self.counters),
+            "timings": timings,
+            "gauges": gauges
+        }
+        if self.counters.get("jobs_processed") and elapsed > 0:
+            summary["jobs_per_hour"] = round(self.counters["jobs_processed"] * 3600 / elapsed, 1)
+        return summary
+
+    def print_summary(self):
+        summary = self.summary()
+        print("\n" + "=" * 60)
+        print("📊 RUN METRICS")
+        print("=" * 60)
+        print(f"Elapsed: {summary['elapsed_s']}s")
+        for key, value in summary["info"].items():
+            print(f"{key}: {value}")
+        for key, value in summary["counters"].items():
+            print(f"{key}: {value}")
+        for key, value in summary["timings"].items():
+            print(f"{key}: {value['count']} calls, avg {value['avg_ms']}ms, total {value['total_ms']}ms")
+        for key, value in summary["gauges"].items():
+            print(f"{key}: avg {value['avg']}, max {value['max']} ({value['count']} samples)")
+        if "jobs_per_hour" in summary:
+            print(f"Throughput: {summary['jobs_per_hour']} jobs/hour")
+        print("=" * 60)
+
+    def dump(self, path=RUN_METRICS_PATH):
+        """Append this run's summary as one JSON line"""
+        try:
+            with open(path, "a") as f:
+                f.write(json.dumps(self.summary()) + "\n")
+        except Exception as e:
+            print(f"⚠️ Failed to write run metrics: {e}")
+
+
+# Shared instance for the current process
+run_metrics = RunMetrics()
@@ -0,0 +1,160 @@
+import itertools
+from collections import defaultdict
+from run_metrics import run_metrics
+
+# Attribute set on the element a resolve call picked, so Playwright can address it
+FILL_TARGET_ATTR = "data-agent-fill-target"
+
+# Tries every candidate selector in order within one evaluate call and marks the
+# first visible match. Invalid selectors are reported instead of aborting the pass.
+RESOLVE_SELECTORS_JS = """
+({selectors, attr, token}) => {
+    document.querySelectorAll('[' + attr + ']').forEach(el => el.removeAttribute(attr));
+
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        if (rect.width === 0 || rect.height === 0) return false;
+        return window.getComputedStyle(el).visibility !== 'hidden';
+    };
+
+    const invalid = [];
+    for (let i = 0; i < selectors.length; i++) {
+        let matches;
+        try {
+            matches = document.querySelectorAll(selectors[i]);
+        } catch (e) {
+            invalid.push(i);
+            continue;
+        }
+        const el = Array.from(matches).find(isVisible);
+        if (el) {
+            el.setAttribute(attr, token);
+            return {index: i, invalid: invalid};
+        }
+    }
+    return {index: -1, invalid: invalid};
+}
+"""
+
+# Field kinds whose winning selector strategy is remembered across lookups
+FIELD_KINDS = ['email', 'password', 'job_title', 'location', 'phone']
+
+
+def field_kind(field_identifier, field_type=""):
+    """Classify an input by its identifier/type the same way fill_input_field picks values"""
+    id_lower = (field_identifier or "").lower()
+    field_type_lower = (field_type or "").lower()
+    if field_type_lower == "email" or "email" in id_lower or "username" in id_lower:
+        return "email"
+    if field_type_lower == "password" or "password" in id_lower:
+        return "password"
+    if field_type_lower in ["job_title", "title", "role", "skill", "company"] or any(kw in id_lower for kw in ["job", "title", "skill", "company"]):
+        return "job_title"
+    if field_type_lower == "location" or "location" in id_lower:
+        return "location"
+    if field_type_lower == "phone" or "phone" in id_lower:
+        return "phone"
+    return None
+
+
+class SelectorResolver:
+    """
+    Resolves an element from a list of selector strategies in one page round trip.
+
+    Strategies are selector templates where '{id}' is replaced by the field
+    identifier (e.g. '#{id}', '[name="{id}"]', '#session_key'). The strategy that
+    wins for a field kind is tried first on that kind's later lookups.
+    """
+
+    def __init__(self):
+        self.preferred = {}
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+        self.invalid = defaultdict(int)
+        self._tokens = itertools.count(1)
+
+    def _ordered(self, kind, strategies):
+        strategies = list(dict.fromkeys(strategies))
+        preferred = self.preferred.get(kind)
+        if preferred in strategies:
+            strategies.remove(preferred)
+            strategies.insert(0, preferred)
+        return strategies
+
+    async def resolve(self, page, strategies, identifier="", kind=None):
+        """
+        Find the first visible element matched by the strategies.
+
+        Returns:
+            (locator, strategy) for the winning strategy, or (None, None)
+        """
+        strategies = self._ordered(kind, strategies)
+        selectors = [strategy.replace("{id}", identifier) for strategy in strategies]
+        token = str(next(self._tokens))
+
+        result = await page.evaluate(RESOLVE_SELECTORS_JS, {
+            'selectors': selectors,
+            'attr': FILL_TARGET_ATTR,
+            'token': token
+        })
+
+        for i in result['invalid']:
+            self.invalid[strategies[i]] += 1
+        checked = strategies if result['index'] < 0 else strategies[:result['index']]
+        for strategy in checked:
+            self.misses[strategy] += 1
+
+        if result['index'] < 0:
+            run_metrics.incr("selector_resolve_misses")
+            return None, None
+
+        strategy = strategies[result['index']]
+        self.hits[strategy] += 1
+        run_metrics.incr("selector_resolve_hits")
+        if kind:
+            self.preferred[kind] = strategy
+        locator = page.locator(f'[{FILL_TARGET_ATTR}="{token}"]').first
+        return locator, strategy
+
+    def stats(self):
+        """Per-strategy hit/miss/invalid counts and the preferred strategy per field kind"""
+        strategies = set(self.hits) | set(self.misses) | set(self.invalid)
+        return {
+            'preferred': dict(self.preferred),
+            'strategies': {
+                strategy: {
+                    'hits': self.hits[strategy],
+                    'misses': self.misses[strategy],
+                    'invalid': self.invalid[strategy]
+                }
+                for strategy in sorted(strategies)
+            }
+        }
+
+    def dead_strategies(self, min_tries=5):
+        """Strategies tried at least min_tries times that never matched"""
+        return [
+            strategy for strategy, counts in self.stats()['strategies'].items()
+            if counts['hits'] == 0 and counts['misses'] + counts['invalid'] >= min_tries
+        ]
+
+    def print_stats(self):
+        stats = self.stats()
+        if not stats['strategies']:
+            return
+        print("\n🎯 Selector resolver stats:")
+        for strategy, counts in stats['strategies'].items():
+            print(f"   {strategy}: {counts['hits']} hits, {counts['misses']} misses, {counts['invalid']} invalid")
+        for kind, strategy in stats['preferred'].items():
+            print(f"   preferred for {kind}: {strategy}")
+
+
+_selector_resolver = None
+
+
+def get_selector_resolver():
+    """Shared resolver, so learned strategies carry across tools and workers"""
+    global _selector_resolver
+    if _selector_resolver is None:
+        _selector_resolver = SelectorResolver()
+    return _selector_resolver
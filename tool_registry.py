@@ -0,0 +1,55 @@
+from tools import ALL_TOOLS, current_navigator
+from tracing import get_tracer
+
+# Tool schemas are derived once, when tools.py is imported
+TOOLS_BY_NAME = {t.name: t for t in ALL_TOOLS}
+
+# (id(model), tool names) -> (model, bound model); the model is kept so its id stays unique
+_bound_models = {}
+
+
+def get_tools(names=None):
+    """All tools, or the named subset in the given order"""
+    if names is None:
+        return list(ALL_TOOLS)
+    return [TOOLS_BY_NAME[name] for name in names]
+
+
+def get_tool(name):
+    return TOOLS_BY_NAME.get(name)
+
+
+def get_bound_model(model, names=None):
+    """model.bind_tools(...) for a tool subset, built once per (model, subset)"""
+    key = (id(model), tuple(names) if names is not None else None)
+    cached = _bound_models.get(key)
+    if cached is None or cached[0] is not model:
+        cached = (model, model.bind_tools(get_tools(names)))
+        _bound_models[key] = cached
+    return cached[1]
+
+
+def _span_args(args):
+    """Tool arguments as short span attributes; values typed into fields are left out"""
+    return {
+        key: str(value)[:80] for key, value in (args or {}).items()
+        if key not in ('value', 'text', 'password')
+    }
+
+
+async def invoke_tool(navigator, name, args):
+    """
+    Run a tool against the given navigator's page.
+
+    Raises:
+        KeyError: if no tool has this name
+    """
+    tool = TOOLS_BY_NAME[name]
+    token = current_navigator.set(navigator)
+    try:
+        with get_tracer().span(f"tool.{name}", **_span_args(args)) as span:
+            result = await tool.ainvoke(args)
+            span.set(result=str(result)[:80])
+            return result
+    finally:
+        current_navigator.reset(token)
@@ -0,0 +1,165 @@
+import json
+import math
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from config import TRACING_ENABLED, TRACE_PATH, TRACE_FLUSH_EVERY
+
+# Span the current task is inside; asyncio tasks copy it, so spans started in
+# gathered or hedged tasks still get the right parent
+_current_span = ContextVar("current_span", default=None)
+
+# Attributes a span takes from its parent unless given explicitly
+INHERITED_ATTRS = ['job_id']
+
+
+class Span:
+    """One timed operation; attributes can be added while it is open with set()"""
+
+    def __init__(self, name, span_id, parent, attrs):
+        self.name = name
+        self.span_id = span_id
+        self.parent_id = parent.span_id if parent else None
+        self.attrs = attrs
+        self.started_at = time.time()
+        self.duration_ms = None
+        self.error = None
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def to_record(self, run_id):
+        return {
+            'run_id': run_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'start': round(self.started_at, 3),
+            'duration_ms': round(self.duration_ms, 2),
+            'status': 'error' if self.error else 'ok',
+            'error': self.error,
+            'attrs': self.attrs
+        }
+
+
+def _percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    index = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class Tracer:
+    """
+    Records timed spans for the current run. Spans are buffered and appended to
+    a JSONL file; durations are also kept per span name for the end-of-run summary.
+    """
+
+    def __init__(self, path=TRACE_PATH, enabled=TRACING_ENABLED, flush_every=TRACE_FLUSH_EVERY):
+        self.path = path
+        self.enabled = enabled
+        self.flush_every = max(1, flush_every)
+        self.run_id = uuid.uuid4().hex[:12]
+        self.next_id = 0
+        self.pending = []
+        self.durations = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def _start(self, name, attrs):
+        parent = _current_span.get()
+        if parent is not None:
+            for key in INHERITED_ATTRS:
+                if key in parent.attrs:
+                    attrs.setdefault(key, parent.attrs[key])
+        self.next_id += 1
+        return Span(name, self.next_id, parent, attrs)
+
+    def _finish(self, span):
+        if not self.enabled:
+            return
+        self.durations[span.name].append(span.duration_ms)
+        if span.error:
+            self.errors[span.name] += 1
+        self.pending.append(span.to_record(self.run_id))
+        if len(self.pending) >= self.flush_every:
+            self.flush()
+
+    @contextmanager
+    def span(self, name, **attrs):
+        """
+        Time the enclosed block as a span named `name` (e.g. 'llm.answer_generation').
+        Nested spans record it as their parent. An exception marks the span as
+        failed and is re-raised.
+        """
+        span = self._start(name, attrs)
+        token = _current_span.set(span)
+        started = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"[:300]
+            raise
+        finally:
+            span.duration_ms = (time.perf_counter() - started) * 1000
+            _current_span.reset(token)
+            self._finish(span)
+
+    def record(self, name, started, **attrs):
+        """Record a span that was timed elsewhere, from a time.perf_counter() start until now"""
+        span = self._start(name, attrs)
+        span.duration_ms = (time.perf_counter() - started) * 1000
+        span.started_at = time.time() - span.duration_ms / 1000
+        self._finish(span)
+        return span
+
+    def flush(self):
+        """Append buffered spans to the trace file"""
+        if not self.pending:
+            return
+        records, self.pending = self.pending, []
+        try:
+            with open(self.path, "a") as f:
+                for record in records:
+                    f.write(json.dumps(record, default=str) + "\n")
+        except Exception as e:
+            print(f"⚠️ Failed to write trace spans: {e}")
+
+    def summary(self):
+        """Per span name: count, errors, p50, p95, max and total in milliseconds"""
+        summary = {}
+        for name, values in self.durations.items():
+            ordered = sorted(values)
+            summary[name] = {
+                'count': len(ordered),
+                'errors': self.errors.get(name, 0),
+                'p50_ms': round(_percentile(ordered, 0.50), 1),
+                'p95_ms': round(_percentile(ordered, 0.95), 1),
+                'max_ms': round(ordered[-1], 1),
+                'total_ms': round(sum(ordered), 1)
+            }
+        return summary
+
+    def print_summary(self):
+        summary = self.summary()
+        if not summary:
+            return
+        print("\n" + "=" * 60)
+        print(f"⏱️ TRACE SPANS (run {self.run_id}, {self.path})")
+        print("=" * 60)
+        for name, value in sorted(summary.items(), key=lambda item: item[1]['total_ms'], reverse=True):
+            errors = f", {value['errors']} errors" if value['errors'] else ""
+            print(f"{name}: {value['count']} spans, p50 {value['p50_ms']}ms, p95 {value['p95_ms']}ms, "
+                  f"max {value['max_ms']}ms, total {value['total_ms']}ms{errors}")
+        print("=" * 60)
+
+
+_tracer = None
+
+
+def get_tracer():
+    """Shared tracer, so spans from every worker land in the same run"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
@@ -1,12 +1,98 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
 from PyPDF2 import PdfReader
+from config import RESUME_CACHE_DIR
+
+# (absolute path, mtime_ns, size) -> parsed resume; guarded by _resume_lock so
+# concurrent workers parse a given resume version only once
+_resume_cache = {}
+_resume_lock = threading.Lock()
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _resume_key(resume_path):
+    stat = os.stat(resume_path)
+    return (os.path.abspath(resume_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _parse_resume_pages(resume_path):
+    reader = PdfReader(resume_path)
+    return [page.extract_text() or "" for page in reader.pages]
+
+
+def load_resume(resume_path):
+    """
+    Parse a PDF resume once and cache the result in memory and on disk.
+
+    Returns:
+        dict with 'sha256', 'text' and per-page 'pages' text
+    """
+    if not resume_path.lower().endswith(".pdf"):
+        raise ValueError("Only PDF resumes supported in current setup.")
+
+    key = _resume_key(resume_path)
+
+    with _resume_lock:
+        cached = _resume_cache.get(key)
+        if cached is not None:
+            return cached
+
+        sha256 = _file_sha256(resume_path)
+        cache_file = os.path.join(RESUME_CACHE_DIR, f"{sha256}.json") if RESUME_CACHE_DIR else None
+
+        entry = None
+        if cache_file and os.path.exists(cache_file):
+            try:
+                with open(cache_file, "r") as f:
+                    entry = json.load(f)
+            except Exception as e:
+                print(f"⚠️ Ignoring unreadable resume cache {cache_file}: {e}")
+
+        if entry is None:
+            pages = _parse_resume_pages(resume_path)
+            entry = {"sha256": sha256, "text": "".join(pages), "pages": pages}
+            if cache_file:
+                try:
+                    os.makedirs(RESUME_CACHE_DIR, exist_ok=True)
+                    tmp_path = f"{cache_file}.{os.getpid()}.tmp"
+                    with open(tmp_path, "w") as f:
+                        json.dump(entry, f)
+                    os.replace(tmp_path, cache_file)
+                except Exception as e:
+                    print(f"⚠️ Failed to write resume cache: {e}")
+
+        _resume_cache[key] = entry
+        return entry
+
+
+def resume_sha256(resume_path):
+    """Content hash of the resume, taken from the parse cache when it holds this version"""
+    key = _resume_key(resume_path)
+    with _resume_lock:
+        cached = _resume_cache.get(key)
+    return cached["sha256"] if cached is not None else _file_sha256(resume_path)
+
+
+async def resume_sha256_async(resume_path):
+    """resume_sha256 in a thread, so the event loop never waits on a resume parse or a cold hash"""
+    return await asyncio.to_thread(resume_sha256, resume_path)
+
 
 def extract_text_from_resume(resume_path):
     """Basic text extractor for PDF resumes"""
-    text = ""
-    if resume_path.lower().endswith(".pdf"):
-        reader = PdfReader(resume_path)
-        for page in reader.pages:
-            text += page.extract_text() or ""
-    else:
-        raise ValueError("Only PDF resumes supported in current setup.")
-    return text
+    return load_resume(resume_path)["text"]
+
+
+async def extract_text_from_resume_async(resume_path):
+    """extract_text_from_resume without blocking the event loop on a cold cache"""
+    return await asyncio.to_thread(extract_text_from_resume, resume_path)
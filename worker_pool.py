@@ -0,0 +1,122 @@
+import asyncio
+import time
+from config import MAX_CONCURRENT_APPLICATIONS
+
+
+class ApplicationWorker:
+    """
+    One concurrent applier with its own page and navigator. Tools are bound to
+    the worker's navigator per call through tool_registry.invoke_tool.
+    """
+
+    def __init__(self, worker_id, navigator):
+        self.worker_id = worker_id
+        self.navigator = navigator
+        self.results = []
+
+    def report(self):
+        statuses = [r['status'] for r in self.results]
+        return {
+            'worker_id': self.worker_id,
+            'jobs': len(self.results),
+            'applied': statuses.count('applied'),
+            'failed': len(statuses) - statuses.count('applied'),
+            'busy_s': round(sum(r['duration_s'] for r in self.results), 1),
+            'results': self.results
+        }
+
+
+class ApplicationWorkerPool:
+    """
+    Runs job applications concurrently on separate pages of the navigator's
+    logged-in BrowserContext, so all workers share one session.
+    """
+
+    def __init__(self, navigator, job_handler, concurrency=MAX_CONCURRENT_APPLICATIONS):
+        self.navigator = navigator
+        self.job_handler = job_handler
+        self.concurrency = max(1, concurrency)
+
+    async def run(self, job_links):
+        """
+        Apply to every link in job_links with up to `concurrency` workers.
+
+        job_links may be a list or an async iterator (e.g. job discovery), in
+        which case workers start on the first links while later ones are found.
+        job_handler is awaited as job_handler(worker, job_link) and returns a status string.
+
+        Returns:
+            list of per-worker reports
+        """
+        # Bounded, so a fast producer stays only a little ahead of the workers
+        queue = asyncio.Queue(maxsize=self.concurrency * 2)
+
+        worker_count = self.concurrency
+        if isinstance(job_links, list):
+            worker_count = min(self.concurrency, len(job_links)) or 1
+            print(f"👷 Starting {worker_count} application worker(s) for {len(job_links)} jobs")
+        else:
+            print(f"👷 Starting {worker_count} application worker(s) for streamed jobs")
+
+        workers = []
+        for worker_id in range(1, worker_count + 1):
+            worker_navigator = await self.navigator.spawn_worker()
+            workers.append(ApplicationWorker(worker_id, worker_navigator))
+
+        try:
+            await asyncio.gather(
+                self._produce(job_links, queue, worker_count),
+                *(self._work(worker, queue) for worker in workers)
+            )
+        finally:
+            for worker in workers:
+                await worker.navigator.close_worker()
+
+        reports = [worker.report() for worker in workers]
+        self._print_reports(reports)
+        return reports
+
+    async def _produce(self, job_links, queue, worker_count):
+        """Feed links into the queue, then one stop marker (None) per worker"""
+        try:
+            if isinstance(job_links, list):
+                for link in job_links:
+                    await queue.put(link)
+            else:
+                async for link in job_links:
+                    await queue.put(link)
+        except Exception as e:
+            print(f"❌ Job link producer failed: {e}")
+        finally:
+            for _ in range(worker_count):
+                await queue.put(None)
+
+    async def _work(self, worker, queue):
+        while True:
+            job_link = await queue.get()
+            if job_link is None:
+                return
+
+            print(f"\n👷 [Worker {worker.worker_id}] ➡️ {job_link}")
+            started = time.perf_counter()
+            try:
+                status = await self.job_handler(worker, job_link)
+            except Exception as e:
+                print(f"❌ [Worker {worker.worker_id}] Unhandled error on {job_link}: {e}")
+                status = "error"
+
+            worker.results.append({
+                'job_link': job_link,
+                'status': status,
+                'duration_s': round(time.perf_counter() - started, 1)
+            })
+            print(f"👷 [Worker {worker.worker_id}] {status}: {job_link}")
+
+    def _print_reports(self, reports):
+        print("\n" + "=" * 60)
+        print("👷 WORKER RESULTS")
+        print("=" * 60)
+        for report in reports:
+            print(f"Worker {report['worker_id']}: {report['jobs']} jobs, "
+                  f"{report['applied']} applied, {report['failed']} not applied, busy {report['busy_s']}s")
+        print("=" * 60)